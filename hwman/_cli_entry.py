@@ -0,0 +1,28 @@
+"""
+Console-script entry point for `hwman`.
+
+`hwman --version` is answered here, before hwman.cli and Typer are imported;
+every other invocation is handed to the Typer app in hwman.cli.
+"""
+
+import sys
+
+
+def _print_version() -> None:
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        print(f"hwman {version('lccfq-hwman')}")
+    except PackageNotFoundError:
+        print("hwman (not installed)")
+
+
+def main() -> None:
+    """`hwman` console script."""
+    if len(sys.argv) == 2 and sys.argv[1] in ("-V", "--version"):
+        _print_version()
+        return
+
+    from hwman.cli import main as cli_main
+
+    cli_main()
@@ -15,18 +15,82 @@ The mTLS flow:
 """
 
 import logging
+import os
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Tuple
+from typing import Dict, Literal, Tuple
 import ipaddress
 
 from cryptography import x509
 from cryptography.x509.oid import NameOID
 from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
 
 logger = logging.getLogger(__name__)
 
+# Private key types the manager can issue and load
+PrivateKey = ec.EllipticCurvePrivateKey | rsa.RSAPrivateKey
+KeyAlgorithm = Literal["ec", "rsa"]
+
+# Subject attributes shared by every certificate we issue; only the CN varies
+_BASE_NAME_ATTRS = (
+    x509.NameAttribute(NameOID.COUNTRY_NAME, "US"),
+    x509.NameAttribute(NameOID.STATE_OR_PROVINCE_NAME, "IL"),
+    x509.NameAttribute(NameOID.LOCALITY_NAME, "Urbana"),
+    x509.NameAttribute(NameOID.ORGANIZATION_NAME, "LCCF Lab"),
+)
+
+# Extensions are immutable values, so the ones that never vary are built once
+_BC_CA = x509.BasicConstraints(ca=True, path_length=None)
+_BC_LEAF = x509.BasicConstraints(ca=False, path_length=None)
+_CA_KEY_USAGE = x509.KeyUsage(
+    key_cert_sign=True,  # Can sign certificates
+    crl_sign=True,  # Can sign certificate revocation lists
+    key_encipherment=False,
+    content_commitment=False,
+    data_encipherment=False,
+    key_agreement=False,
+    digital_signature=False,
+    encipher_only=False,
+    decipher_only=False,
+)
+_SERVER_KEY_USAGE = x509.KeyUsage(
+    key_cert_sign=False,
+    crl_sign=False,
+    key_encipherment=True,  # Can encrypt keys
+    content_commitment=False,
+    data_encipherment=True,  # Can encrypt data
+    key_agreement=False,
+    digital_signature=True,  # Can create digital signatures
+    encipher_only=False,
+    decipher_only=False,
+)
+_CLIENT_KEY_USAGE = x509.KeyUsage(
+    key_cert_sign=False,
+    crl_sign=False,
+    key_encipherment=True,  # Can encrypt keys
+    content_commitment=False,
+    data_encipherment=False,
+    key_agreement=False,
+    digital_signature=True,  # Can create digital signatures
+    encipher_only=False,
+    decipher_only=False,
+)
+_EKU_CLIENT_AUTH = x509.ExtendedKeyUsage(
+    [x509.oid.ExtendedKeyUsageOID.CLIENT_AUTH]  # This cert is for client auth
+)
+
+
+def _load_ca_from_pem(
+    ca_cert_pem: bytes, ca_key_pem: bytes, password: bytes | None = None
+) -> Tuple[x509.Certificate, PrivateKey]:
+    """Parse a PEM encoded CA certificate and (optionally encrypted) private key."""
+    ca_cert = x509.load_pem_x509_certificate(ca_cert_pem)
+    ca_private_key = serialization.load_pem_private_key(ca_key_pem, password=password)
+    # We only ever generate EC or RSA keys
+    assert isinstance(ca_private_key, (ec.EllipticCurvePrivateKey, rsa.RSAPrivateKey))
+    return ca_cert, ca_private_key
+
 
 class CertificateManager:
     """
@@ -39,43 +103,87 @@ class CertificateManager:
     @staticmethod
     def _save_certificate_and_key(
         cert: x509.Certificate,
-        private_key: rsa.RSAPrivateKey,
+        private_key: PrivateKey,
         cert_path: Path,
         key_path: Path,
+        fsync: bool = False,
+        key_password: bytes | None = None,
     ) -> None:
-        """Save a certificate and its private key to files in PEM format."""
+        """
+        Save a certificate and its private key to files in PEM format.
+
+        With `fsync=True` the key file is flushed to stable storage before returning.
+        With `key_password` the key is encrypted at rest (BestAvailableEncryption).
+        """
 
         # Serialize certificate to PEM format
         cert_pem = cert.public_bytes(serialization.Encoding.PEM)
 
-        # Serialize private key to PEM format (unencrypted for simplicity)
+        # Serialize private key to PEM format, unencrypted unless a password is given
+        encryption: serialization.KeySerializationEncryption = (
+            serialization.BestAvailableEncryption(key_password)
+            if key_password
+            else serialization.NoEncryption()
+        )
         key_pem = private_key.private_bytes(
             encoding=serialization.Encoding.PEM,
             format=serialization.PrivateFormat.PKCS8,
-            encryption_algorithm=serialization.NoEncryption(),
+            encryption_algorithm=encryption,
         )
 
         # Write to files
-        with open(cert_path, "wb") as f:
-            f.write(cert_pem)
-        with open(key_path, "wb") as f:
-            f.write(key_pem)
+        cert_path.write_bytes(cert_pem)
+        key_path.write_bytes(key_pem)
+
+        if fsync:
+            fd = os.open(key_path, os.O_WRONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
 
         logger.info(f"Saved certificate: {cert_path}")
         logger.info(f"Saved private key: {key_path}")
 
+    def _generate_private_key(self) -> PrivateKey:
+        """Generate a new private key for certificates using the configured algorithm."""
+        if self.key_algo == "rsa":
+            return rsa.generate_private_key(
+                public_exponent=65537,  # Standard RSA exponent
+                key_size=2048,  # 2048-bit key (good security/performance balance)
+            )
+        # P-256 keygen is sub-millisecond, compared to 100+ ms for RSA-2048.
+        # Ed25519 would be cheaper still, but gRPC's TLS stack does not accept it.
+        return ec.generate_private_key(ec.SECP256R1())
+
     @staticmethod
-    def _generate_private_key() -> rsa.RSAPrivateKey:
-        """Generate a new RSA private key for certificates."""
-        return rsa.generate_private_key(
-            public_exponent=65537,  # Standard RSA exponent
-            key_size=2048,  # 2048-bit key (good security/performance balance)
-        )
+    def _signature_hash(signing_key: PrivateKey) -> hashes.HashAlgorithm:
+        """Pick the digest used when signing with ``signing_key``.
+
+        RSA signatures use SHA-384, which OpenSSL hashes faster than SHA-256 on
+        64-bit hosts. ECDSA P-256 keeps SHA-256, the digest matched to the curve.
+        """
+        if isinstance(signing_key, rsa.RSAPrivateKey):
+            return hashes.SHA384()
+        return hashes.SHA256()
 
-    def __init__(self, cert_dir: Path):
+    def __init__(
+        self,
+        cert_dir: Path,
+        key_algo: KeyAlgorithm = "ec",
+        ca_key_password: bytes | None = None,
+    ):
         """
         Initialize certificate manager with a directory to store certificates.
 
+        New keys are generated with `key_algo`: "ec" (ECDSA P-256, default) or
+        "rsa" (2048-bit RSA). Existing CA keys of either type are always accepted.
+
+        With `ca_key_password`, a newly created CA key is encrypted at rest and
+        the password is used to decrypt an existing one. Server and client keys
+        stay unencrypted because gRPC has to read them as-is. Decryption runs
+        the key's KDF, so it is paid once per parsed CA (see `_load_ca`).
+
         Directory structure will be:
         cert_dir/
         ├── ca.crt          # CA certificate (public)
@@ -88,6 +196,8 @@ class CertificateManager:
             └── ...
         """
         self.cert_dir = Path(cert_dir)
+        self.key_algo = key_algo
+        self.ca_key_password = ca_key_password or None
         self.cert_dir.mkdir(parents=True, exist_ok=True)
 
         # Certificate file paths
@@ -100,7 +210,29 @@ class CertificateManager:
         self.clients_dir = self.cert_dir / "clients"
         self.clients_dir.mkdir(exist_ok=True)
 
-    def _create_ca_certificate(self) -> Tuple[x509.Certificate, rsa.RSAPrivateKey]:
+        # Parsed CA, tagged with the mtime of the CA key file it was loaded from
+        self._ca_cache: Tuple[int, x509.Certificate, PrivateKey] | None = None
+
+    def _load_ca(self) -> Tuple[x509.Certificate, PrivateKey]:
+        """
+        Load the CA certificate and private key from disk.
+
+        The parsed pair is cached on the instance and only reloaded when the CA
+        key file's modification time changes.
+        """
+        mtime_ns = self.ca_key_file.stat().st_mtime_ns
+        if self._ca_cache is not None and self._ca_cache[0] == mtime_ns:
+            return self._ca_cache[1], self._ca_cache[2]
+
+        ca_cert, ca_private_key = _load_ca_from_pem(
+            self.ca_cert_file.read_bytes(),
+            self.ca_key_file.read_bytes(),
+            self.ca_key_password,
+        )
+        self._ca_cache = (mtime_ns, ca_cert, ca_private_key)
+        return ca_cert, ca_private_key
+
+    def _create_ca_certificate(self) -> Tuple[x509.Certificate, PrivateKey]:
         """
         Create a Certificate Authority (CA) certificate.
 
@@ -111,15 +243,13 @@ class CertificateManager:
 
         # Generate private key for CA
         ca_private_key = self._generate_private_key()
+        now = datetime.now(timezone.utc)
 
         # Create the CA certificate
         # Note: For CA certificates, subject == issuer (self-signed)
         subject = issuer = x509.Name(
             [
-                x509.NameAttribute(NameOID.COUNTRY_NAME, "US"),
-                x509.NameAttribute(NameOID.STATE_OR_PROVINCE_NAME, "IL"),
-                x509.NameAttribute(NameOID.LOCALITY_NAME, "Urbana"),
-                x509.NameAttribute(NameOID.ORGANIZATION_NAME, "LCCF Lab"),
+                *_BASE_NAME_ATTRS,
                 x509.NameAttribute(NameOID.COMMON_NAME, "LCCF CA"),  # CA name
             ]
         )
@@ -132,32 +262,19 @@ class CertificateManager:
             )
             .public_key(ca_private_key.public_key())
             .serial_number(x509.random_serial_number())
-            .not_valid_before(datetime.now(timezone.utc))
-            .not_valid_after(
-                datetime.now(timezone.utc)
-                + timedelta(days=3650)  # CA valid for 10 years
-            )
+            .not_valid_before(now)
+            .not_valid_after(now + timedelta(days=3650))  # CA valid for 10 years
             .add_extension(
                 # Mark this as a CA certificate (can sign other certificates)
-                x509.BasicConstraints(ca=True, path_length=None),
+                _BC_CA,
                 critical=True,
             )
             .add_extension(
                 # Define what this certificate can be used for
-                x509.KeyUsage(
-                    key_cert_sign=True,  # Can sign certificates
-                    crl_sign=True,  # Can sign certificate revocation lists
-                    key_encipherment=False,
-                    content_commitment=False,
-                    data_encipherment=False,
-                    key_agreement=False,
-                    digital_signature=False,
-                    encipher_only=False,
-                    decipher_only=False,
-                ),
+                _CA_KEY_USAGE,
                 critical=True,
             )
-            .sign(ca_private_key, hashes.SHA256())
+            .sign(ca_private_key, self._signature_hash(ca_private_key))
         )
 
         return ca_cert, ca_private_key
@@ -165,9 +282,9 @@ class CertificateManager:
     def _create_server_certificate(
         self,
         ca_cert: x509.Certificate,
-        ca_private_key: rsa.RSAPrivateKey,
+        ca_private_key: PrivateKey,
         hostname: str = "localhost",
-    ) -> Tuple[x509.Certificate, rsa.RSAPrivateKey]:
+    ) -> Tuple[x509.Certificate, PrivateKey]:
         """
         Create a server certificate signed by the CA.
 
@@ -177,14 +294,12 @@ class CertificateManager:
 
         # Generate private key for server
         server_private_key = self._generate_private_key()
+        now = datetime.now(timezone.utc)
 
         # Create server certificate
         subject = x509.Name(
             [
-                x509.NameAttribute(NameOID.COUNTRY_NAME, "US"),
-                x509.NameAttribute(NameOID.STATE_OR_PROVINCE_NAME, "IL"),
-                x509.NameAttribute(NameOID.LOCALITY_NAME, "Urbana"),
-                x509.NameAttribute(NameOID.ORGANIZATION_NAME, "LCCF Lab"),
+                *_BASE_NAME_ATTRS,
                 x509.NameAttribute(NameOID.COMMON_NAME, hostname),  # Server hostname
             ]
         )
@@ -197,11 +312,8 @@ class CertificateManager:
             )
             .public_key(server_private_key.public_key())
             .serial_number(x509.random_serial_number())
-            .not_valid_before(datetime.now(timezone.utc))
-            .not_valid_after(
-                datetime.now(timezone.utc)
-                + timedelta(days=365)  # Server cert valid for 1 year
-            )
+            .not_valid_before(now)
+            .not_valid_after(now + timedelta(days=365))  # Server cert valid for 1 year
             .add_extension(
                 # Alternative names for the server (localhost, 127.0.0.1, etc.)
                 x509.SubjectAlternativeName(
@@ -215,32 +327,22 @@ class CertificateManager:
             )
             .add_extension(
                 # This is NOT a CA certificate
-                x509.BasicConstraints(ca=False, path_length=None),
+                _BC_LEAF,
                 critical=True,
             )
             .add_extension(
                 # Define server certificate usage
-                x509.KeyUsage(
-                    key_cert_sign=False,
-                    crl_sign=False,
-                    key_encipherment=True,  # Can encrypt keys
-                    content_commitment=False,
-                    data_encipherment=True,  # Can encrypt data
-                    key_agreement=False,
-                    digital_signature=True,  # Can create digital signatures
-                    encipher_only=False,
-                    decipher_only=False,
-                ),
+                _SERVER_KEY_USAGE,
                 critical=True,
             )
-            .sign(ca_private_key, hashes.SHA256())
+            .sign(ca_private_key, self._signature_hash(ca_private_key))
         )  # Signed by CA's private key
 
         return server_cert, server_private_key
 
     def _create_client_certificate(
-        self, ca_cert: x509.Certificate, ca_private_key: rsa.RSAPrivateKey, user_id: str
-    ) -> Tuple[x509.Certificate, rsa.RSAPrivateKey]:
+        self, ca_cert: x509.Certificate, ca_private_key: PrivateKey, user_id: str
+    ) -> Tuple[x509.Certificate, PrivateKey]:
         """
         Create a client certificate for a specific user, signed by the CA.
 
@@ -251,14 +353,12 @@ class CertificateManager:
 
         # Generate private key for client
         client_private_key = self._generate_private_key()
+        now = datetime.now(timezone.utc)
 
         # Create client certificate with user_id in Common Name
         subject = x509.Name(
             [
-                x509.NameAttribute(NameOID.COUNTRY_NAME, "US"),
-                x509.NameAttribute(NameOID.STATE_OR_PROVINCE_NAME, "IL"),
-                x509.NameAttribute(NameOID.LOCALITY_NAME, "Urbana"),
-                x509.NameAttribute(NameOID.ORGANIZATION_NAME, "LCCF Lab"),
+                *_BASE_NAME_ATTRS,
                 x509.NameAttribute(NameOID.COMMON_NAME, user_id),  # USER ID HERE!
             ]
         )
@@ -271,41 +371,24 @@ class CertificateManager:
             )
             .public_key(client_private_key.public_key())
             .serial_number(x509.random_serial_number())
-            .not_valid_before(datetime.now(timezone.utc))
-            .not_valid_after(
-                datetime.now(timezone.utc)
-                + timedelta(days=365)  # Client cert valid for 1 year
-            )
+            .not_valid_before(now)
+            .not_valid_after(now + timedelta(days=365))  # Client cert valid for 1 year
             .add_extension(
                 # This is NOT a CA certificate
-                x509.BasicConstraints(ca=False, path_length=None),
+                _BC_LEAF,
                 critical=True,
             )
             .add_extension(
                 # Define client certificate usage
-                x509.KeyUsage(
-                    key_cert_sign=False,
-                    crl_sign=False,
-                    key_encipherment=True,  # Can encrypt keys
-                    content_commitment=False,
-                    data_encipherment=False,
-                    key_agreement=False,
-                    digital_signature=True,  # Can create digital signatures
-                    encipher_only=False,
-                    decipher_only=False,
-                ),
+                _CLIENT_KEY_USAGE,
                 critical=True,
             )
             .add_extension(
                 # Extended key usage for client authentication
-                x509.ExtendedKeyUsage(
-                    [
-                        x509.oid.ExtendedKeyUsageOID.CLIENT_AUTH,  # This cert is for client auth
-                    ]
-                ),
+                _EKU_CLIENT_AUTH,
                 critical=True,
             )
-            .sign(ca_private_key, hashes.SHA256())
+            .sign(ca_private_key, self._signature_hash(ca_private_key))
         )  # Signed by CA's private key
 
         return client_cert, client_private_key
@@ -326,18 +409,17 @@ class CertificateManager:
             # Create CA certificate
             ca_cert, ca_private_key = self._create_ca_certificate()
             self._save_certificate_and_key(
-                ca_cert, ca_private_key, self.ca_cert_file, self.ca_key_file
+                ca_cert,
+                ca_private_key,
+                self.ca_cert_file,
+                self.ca_key_file,
+                fsync=True,
+                key_password=self.ca_key_password,
             )
         else:
             logger.info("CA certificate already exists")
             # Load existing CA
-            with open(self.ca_cert_file, "rb") as f:
-                ca_cert = x509.load_pem_x509_certificate(f.read())
-            with open(self.ca_key_file, "rb") as f:
-                loaded_key = serialization.load_pem_private_key(f.read(), password=None)
-                # We know this is an RSA key since we always generate RSA keys
-                assert isinstance(loaded_key, rsa.RSAPrivateKey)
-                ca_private_key = loaded_key
+            ca_cert, ca_private_key = self._load_ca()
 
         # Check if server certificate already exists
         if not (self.server_cert_file.exists() and self.server_key_file.exists()):
@@ -364,13 +446,7 @@ class CertificateManager:
         """
 
         # Load CA certificate and key
-        with open(self.ca_cert_file, "rb") as f:
-            ca_cert = x509.load_pem_x509_certificate(f.read())
-        with open(self.ca_key_file, "rb") as f:
-            loaded_key = serialization.load_pem_private_key(f.read(), password=None)
-            # We know this is an RSA key since we always generate RSA keys
-            assert isinstance(loaded_key, rsa.RSAPrivateKey)
-            ca_private_key = loaded_key
+        ca_cert, ca_private_key = self._load_ca()
 
         # Create client certificate
         client_cert, client_private_key = self._create_client_certificate(
@@ -393,11 +469,18 @@ class CertificateManager:
 
         Returns dict of {user_id: (cert_path, key_path)}
         """
-        clients = {}
-        for cert_file in self.clients_dir.glob("*.crt"):
-            user_id = cert_file.stem  # filename without extension
-            key_file = self.clients_dir / f"{user_id}.key"
-            if key_file.exists():
-                clients[user_id] = (cert_file, key_file)
-
-        return clients
+        # One directory read instead of a glob plus a stat per certificate
+        certs: Dict[str, str] = {}
+        keys: Dict[str, str] = {}
+        with os.scandir(self.clients_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".crt"):
+                    certs[entry.name[:-4]] = entry.path
+                elif entry.name.endswith(".key"):
+                    keys[entry.name[:-4]] = entry.path
+
+        return {
+            user_id: (Path(cert_path), Path(keys[user_id]))
+            for user_id, cert_path in certs.items()
+            if user_id in keys
+        }
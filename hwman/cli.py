@@ -3,20 +3,21 @@
 Main CLI for the Hardware Management (hwman) tool.
 """
 
-import copy
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
 import sys
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
-from cryptography import x509
-from dotenv import load_dotenv
 
-from hwman.certificate_manager import CertificateManager
-from hwman.config import HwmanSettings
-from hwman.main import Server
+if TYPE_CHECKING:
+    from cryptography import x509
 
 app = typer.Typer(
     name="hwman",
@@ -31,7 +32,11 @@ cert_app = typer.Typer(
 
 
 class ColoredFormatter(logging.Formatter):
-    """Custom formatter that adds colors based on logger name and level."""
+    """Custom formatter that adds colors based on logger name and level.
+
+    Output is always "asctime - name - levelname - message"; only `datefmt`
+    is configurable.
+    """
     
     # ANSI color codes
     COLORS = {
@@ -60,48 +65,93 @@ class ColoredFormatter(logging.Formatter):
         # Check if output is a terminal
         self.use_colors = hasattr(sys.stderr, 'isatty') and sys.stderr.isatty()
 
+        # Precompute the colored strings so format() only does dict lookups
+        self._name_prefix = {
+            name: f"{color}{name}{self.RESET}"
+            for name, color in self.SERVICE_COLORS.items()
+        }
+        self._level_prefix = {
+            level: f"{color}{level}{self.RESET}"
+            for level, color in self.COLORS.items()
+        }
+
     def format(self, record):
-        if not self.use_colors:
-            return super().format(record)
-        
-        # Create a copy of the record to avoid mutating the original
-        record_copy = copy.copy(record)
-        
-        # Get color for service (logger name)
-        service_color = self.SERVICE_COLORS.get(record_copy.name, '')
-        
-        # Get color for log level
-        level_color = self.COLORS.get(record_copy.levelname, '')
-        
-        # Apply colors to specific parts
-        if service_color:
-            record_copy.name = f"{service_color}{record_copy.name}{self.RESET}"
-        if level_color:
-            record_copy.levelname = f"{level_color}{record_copy.levelname}{self.RESET}"
-            
-        return super().format(record_copy)
-
-
-def setup_logging(log_level: str = "INFO") -> None:
-    """Configure logging for the application."""
+        # Builds "asctime - name - levelname - message" directly rather than
+        # going through %-style substitution of a fmt string for every record.
+        record.message = record.getMessage()
+        asctime = self.formatTime(record, self.datefmt)
+        name, levelname = record.name, record.levelname
+        if self.use_colors:
+            name = self._name_prefix.get(name, name)
+            levelname = self._level_prefix.get(levelname, levelname)
+        s = f"{asctime} - {name} - {levelname} - {record.message}"
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            s = f"{s}\n{record.exc_text}"
+        if record.stack_info:
+            s = f"{s}\n{self.formatStack(record.stack_info)}"
+        return s
+
+
+# Background thread draining the log queue; see setup_logging
+_log_listener: logging.handlers.QueueListener | None = None
+
+
+def _stop_log_listener() -> None:
+    """Flush queued log records at interpreter exit."""
+    if _log_listener is not None:
+        _log_listener.stop()
+
+
+atexit.register(_stop_log_listener)
+
+
+def setup_logging(log_level: int | str = logging.INFO) -> None:
+    """Configure logging for the application.
+
+    ``log_level`` may be a numeric level or a level name such as ``"INFO"``.
+    """
+    if isinstance(log_level, str):
+        level_name = log_level
+        log_level = logging.getLevelName(level_name.upper())
+        if not isinstance(log_level, int):
+            raise ValueError(f"Unknown log level: {level_name}")
     
+    global _log_listener
+
     # Create formatter
-    formatter = ColoredFormatter(
-        fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    formatter = ColoredFormatter(datefmt="%Y-%m-%d %H:%M:%S")
     
     # Setup handler
     handler = logging.StreamHandler()
     handler.setFormatter(formatter)
+
+    # Records are queued by the logging call and written to stderr by a
+    # background listener thread, so request threads never block on the write.
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, handler, respect_handler_level=True
+    )
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    # The queued record carries only the rendered message (plus traceback);
+    # the listener's ColoredFormatter adds time, name and level.
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
     
     # Configure root logger
     logging.basicConfig(
-        level=getattr(logging, log_level.upper()),
-        handlers=[handler],
+        level=log_level,
+        handlers=[queue_handler],
         force=True  # Override any existing configuration
     )
 
+    # Only replace the running listener once the new configuration is in place
+    if _log_listener is not None:
+        _log_listener.stop()
+    listener.start()
+    _log_listener = listener
+
     # Suppress debug noise insturmentserver. This updates multiple debug logging messages for each param requested
     logging.getLogger('instrumentserver').setLevel(logging.INFO)
     logging.getLogger('qcodes').setLevel(logging.INFO)
@@ -117,6 +167,10 @@ def start(
 
     Configuration is loaded from a TOML file. See configs/example_config.toml for an example.
     """
+    # Deferred so that --help and the cert commands don't pay for the server stack
+    from dotenv import load_dotenv
+
+    from hwman.config import HwmanSettings
 
     # Load environment variables from .env file if it exists
     env_file = Path.cwd() / ".env"
@@ -137,18 +191,24 @@ def start(
         typer.echo(f"Error loading configuration: {e}", err=True)
         raise typer.Exit(1)
 
-    # Setup logging
-    setup_logging(config.log_level)
+    # Setup logging. The config validator has already upper-cased the name.
+    level = logging.getLevelName(config.log_level)
+    if not isinstance(level, int):
+        typer.echo(f"Error: unknown log level '{config.log_level}'", err=True)
+        raise typer.Exit(1)
+    setup_logging(level)
 
     # Create logger
     logger = logging.getLogger(__name__)
 
     logger.info("Starting server with configuration from:")
-    logger.info(f"  Config file: {config_path.absolute()}")
-    logger.info(f"  Address: {config.server_address}:{config.server_port}")
-    logger.info(f"  Certificate directory: {config.cert_dir}")
-    logger.info(f"  Log level: {config.log_level}")
-    logger.info(f"  Start external services: {config.start_external_services}")
+    logger.info("  Config file: %s", config_path.absolute())
+    logger.info("  Address: %s:%s", config.server_address, config.server_port)
+    logger.info("  Certificate directory: %s", config.cert_dir)
+    logger.info("  Log level: %s", config.log_level)
+    logger.info("  Start external services: %s", config.start_external_services)
+
+    from hwman.main import Server
 
     try:
         # Initialize server with config
@@ -164,12 +224,26 @@ def start(
         logger.info("Server shutdown requested by user")
         raise typer.Exit(0)
     except Exception as e:
-        logger.error(f"Server failed to start: {e}")
+        logger.error("Server failed to start: %s", e)
         logger.exception("Full traceback:")
         raise typer.Exit(1)
 
 
 # Certificate management commands
+#
+# cryptography (via CertificateManager) is imported inside each command so that
+# only commands that need it load its FFI bindings; `hwman --help` and
+# `hwman --version` skip it, while `hwman start` loads it through hwman.main.
+
+# The CA key password is read from the environment only, never from a command
+# line option, so it does not show up in process listings or shell history.
+CA_KEY_PASSWORD_ENV = "HWMAN_CA_KEY_PASSWORD"
+
+
+def _ca_key_password() -> bytes | None:
+    """Password for the CA private key from $HWMAN_CA_KEY_PASSWORD (unset or empty: unencrypted)."""
+    return os.environ.get(CA_KEY_PASSWORD_ENV, "").encode() or None
+
 
 @cert_app.command("setup-server")
 def cert_setup_server(
@@ -182,26 +256,36 @@ def cert_setup_server(
 ) -> None:
     """Set up CA and server certificates.
 
+    Set HWMAN_CA_KEY_PASSWORD to encrypt the CA private key at rest.
+
     This creates:
     - CA certificate (if not exists)
     - Server certificate (if not exists)
     """
+    from hwman.certificate_manager import CertificateManager
+
     typer.echo(f"Setting up server certificates in: {cert_dir}")
 
-    cert_manager = CertificateManager(Path(cert_dir))
+    cert_manager = CertificateManager(
+        Path(cert_dir), ca_key_password=_ca_key_password()
+    )
     ca_cert_file, server_cert_file, server_key_file = cert_manager.setup_ca_and_server(
         hostname
     )
 
-    typer.echo("Server certificate setup complete!")
-    typer.echo(f"Certificate directory: {cert_dir}")
-    typer.echo(f"CA certificate: {ca_cert_file}")
-    typer.echo(f"Server certificate: {server_cert_file}")
-    typer.echo(f"Server private key: {server_key_file}")
-
-    typer.echo("\nNext steps:")
-    typer.echo("1. Start the server: uv run hwman start")
-    typer.echo("2. Create client certificates: uv run hwman cert create-client <user_id>")
+    _echo_lines(
+        [
+            "Server certificate setup complete!",
+            f"Certificate directory: {cert_dir}",
+            f"CA certificate: {ca_cert_file}",
+            f"Server certificate: {server_cert_file}",
+            f"Server private key: {server_key_file}",
+            "",
+            "Next steps:",
+            "1. Start the server: uv run hwman start",
+            "2. Create client certificates: uv run hwman cert create-client <user_id>",
+        ]
+    )
 
 
 @cert_app.command("create-client")
@@ -215,10 +299,15 @@ def cert_create_client(
 
     The user_id will be embedded in the certificate's Common Name,
     which the server uses to identify the user.
+    If the CA key is encrypted, its password is read from HWMAN_CA_KEY_PASSWORD.
     """
+    from hwman.certificate_manager import CertificateManager
+
     typer.echo(f"Creating client certificate for user: {user_id}")
 
-    cert_manager = CertificateManager(Path(cert_dir))
+    cert_manager = CertificateManager(
+        Path(cert_dir), ca_key_password=_ca_key_password()
+    )
 
     # Check if server certificates exist
     if not (
@@ -236,17 +325,17 @@ def cert_create_client(
             user_id
         )
 
-        typer.echo("Client certificate created successfully!")
-        typer.echo(f"User ID: {user_id}")
-        typer.echo(f"Certificate: {client_cert_file}")
-        typer.echo(f"Private key: {client_key_file}")
-
-        # Display certificate info
-        typer.echo("\nCertificate Details:")
-        _display_certificate_info(client_cert_file)
-
-        typer.echo("\nUsage:")
-        typer.echo(f"  Use these credentials to connect to the hwman server")
+        lines = [
+            "Client certificate created successfully!",
+            f"User ID: {user_id}",
+            f"Certificate: {client_cert_file}",
+            f"Private key: {client_key_file}",
+            "",
+            "Certificate Details:",
+        ]
+        lines += _certificate_info_lines(client_cert_file)
+        lines += ["", "Usage:", "  Use these credentials to connect to the hwman server"]
+        _echo_lines(lines)
 
     except Exception as e:
         typer.echo(f"Failed to create client certificate: {e}", err=True)
@@ -260,6 +349,8 @@ def cert_list_clients(
     ] = "./certs",
 ) -> None:
     """List all existing client certificates."""
+    from hwman.certificate_manager import CertificateManager
+
     cert_manager = CertificateManager(Path(cert_dir))
     clients = cert_manager.list_client_certificates()
 
@@ -270,32 +361,31 @@ def cert_list_clients(
         )
         return
 
-    typer.echo(f"Found {len(clients)} client certificate(s):")
-    typer.echo("")
+    lines = [f"Found {len(clients)} client certificate(s):", ""]
 
+    now = datetime.now(timezone.utc)
     for user_id, (cert_path, key_path) in clients.items():
-        typer.echo(f"User: {user_id}")
-        typer.echo(f"  Certificate: {cert_path}")
-        typer.echo(f"  Private key: {key_path}")
+        lines.append(f"User: {user_id}")
+        lines.append(f"  Certificate: {cert_path}")
+        lines.append(f"  Private key: {key_path}")
 
         # Display expiration info
         try:
-            with open(cert_path, "rb") as f:
-                cert = x509.load_pem_x509_certificate(f.read())
-
-            now = datetime.now(timezone.utc)
+            cert = _load_cert(cert_path)
             expires = cert.not_valid_after_utc
 
             if expires > now:
                 days_left = (expires - now).days
-                typer.echo(f"  Status: Valid (expires in {days_left} days)")
+                lines.append(f"  Status: Valid (expires in {days_left} days)")
             else:
-                typer.echo("  Status: Expired")
+                lines.append("  Status: Expired")
 
         except Exception as e:
-            typer.echo(f"  Status: Could not read certificate: {e}")
+            lines.append(f"  Status: Could not read certificate: {e}")
 
-        typer.echo("")
+        lines.append("")
+
+    _echo_lines(lines)
 
 
 @cert_app.command("status")
@@ -305,69 +395,88 @@ def cert_status(
     ] = "./certs",
 ) -> None:
     """Display the status of server certificates."""
+    from hwman.certificate_manager import CertificateManager
+
     cert_manager = CertificateManager(Path(cert_dir))
 
-    typer.echo(f"Server Certificate Status ({cert_dir}):")
-    typer.echo("")
+    lines = [f"Server Certificate Status ({cert_dir}):", ""]
 
     # Check CA certificate
     if cert_manager.ca_cert_file.exists():
-        typer.echo(f"CA Certificate: {cert_manager.ca_cert_file}")
-        _display_certificate_info(cert_manager.ca_cert_file)
+        lines.append(f"CA Certificate: {cert_manager.ca_cert_file}")
+        lines += _certificate_info_lines(cert_manager.ca_cert_file)
     else:
-        typer.echo(f"CA Certificate missing: {cert_manager.ca_cert_file}")
+        lines.append(f"CA Certificate missing: {cert_manager.ca_cert_file}")
 
-    typer.echo("")
+    lines.append("")
 
     # Check server certificate
     if cert_manager.server_cert_file.exists():
-        typer.echo(f"Server Certificate: {cert_manager.server_cert_file}")
-        _display_certificate_info(cert_manager.server_cert_file)
+        lines.append(f"Server Certificate: {cert_manager.server_cert_file}")
+        lines += _certificate_info_lines(cert_manager.server_cert_file)
     else:
-        typer.echo(f"Server Certificate missing: {cert_manager.server_cert_file}")
+        lines.append(f"Server Certificate missing: {cert_manager.server_cert_file}")
 
-    typer.echo("")
+    lines.append("")
 
     # Overall status
     if cert_manager.ca_cert_file.exists() and cert_manager.server_cert_file.exists():
-        typer.echo("Server certificates are ready!")
-        typer.echo("You can start the server with: uv run hwman start")
+        lines.append("Server certificates are ready!")
+        lines.append("You can start the server with: uv run hwman start")
     else:
-        typer.echo("Server certificates are incomplete!")
-        typer.echo("Run setup-server: uv run hwman cert setup-server")
+        lines.append("Server certificates are incomplete!")
+        lines.append("Run setup-server: uv run hwman cert setup-server")
 
+    _echo_lines(lines)
 
-def _display_certificate_info(cert_file: Path) -> None:
-    """Display detailed information about a certificate."""
-    try:
-        with open(cert_file, "rb") as f:
-            cert = x509.load_pem_x509_certificate(f.read())
 
-        # Extract certificate details
-        subject = cert.subject
+def _echo_lines(lines: list[str]) -> None:
+    """Write a block of output lines with a single echo (one write to stdout)."""
+    typer.echo("\n".join(lines))
+
+
+@lru_cache(maxsize=256)
+def _load_cert_cached(path_str: str, mtime_ns: int) -> "x509.Certificate":
+    from cryptography import x509
+
+    return x509.load_pem_x509_certificate(Path(path_str).read_bytes())
+
+
+def _load_cert(cert_file: Path) -> "x509.Certificate":
+    """Parse a PEM certificate, memoized on (path, mtime) so rewrites are picked up."""
+    return _load_cert_cached(str(cert_file), cert_file.stat().st_mtime_ns)
+
+
+def _certificate_info_lines(cert_file: Path) -> list[str]:
+    """Describe a certificate as indented output lines."""
+    from cryptography import x509
+
+    try:
+        cert = _load_cert(cert_file)
 
         # Get Common Name (user ID)
-        user_id = None
-        for attribute in subject:
-            if attribute.oid == x509.oid.NameOID.COMMON_NAME:
-                user_id = attribute.value
-                break
+        cn_attrs = cert.subject.get_attributes_for_oid(x509.oid.NameOID.COMMON_NAME)
+        user_id = cn_attrs[0].value if cn_attrs else None
+        expires = cert.not_valid_after_utc
 
-        typer.echo(f"  User ID (CN): {user_id}")
-        typer.echo(f"  Valid from: {cert.not_valid_before_utc}")
-        typer.echo(f"  Valid until: {cert.not_valid_after_utc}")
-        typer.echo(f"  Serial number: {cert.serial_number}")
+        lines = [
+            f"  User ID (CN): {user_id}",
+            f"  Valid from: {cert.not_valid_before_utc}",
+            f"  Valid until: {expires}",
+            f"  Serial number: {cert.serial_number}",
+        ]
 
         # Check if expired
         now = datetime.now(timezone.utc)
-        if cert.not_valid_after_utc > now:
-            days_left = (cert.not_valid_after_utc - now).days
-            typer.echo(f"  Status: Valid ({days_left} days remaining)")
+        if expires > now:
+            days_left = (expires - now).days
+            lines.append(f"  Status: Valid ({days_left} days remaining)")
         else:
-            typer.echo("  Status: Expired")
+            lines.append("  Status: Expired")
+        return lines
 
     except Exception as e:
-        typer.echo(f"Could not read certificate: {e}")
+        return [f"Could not read certificate: {e}"]
 
 
 # Register the certificate subcommand
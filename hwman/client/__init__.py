@@ -1,2 +1,5 @@
 from .client import Client as Client
+from .client import ClientPool as ClientPool
+from .client import CircuitBatcher as CircuitBatcher
 from .client import TestType as TestType
+from .async_client import AsyncClient as AsyncClient
@@ -0,0 +1,169 @@
+"""
+asyncio variant of `Client` built on `grpc.aio`.
+
+Coroutines on one AsyncClient share a single channel, so independent probes can
+be fanned out without threads, e.g.:
+
+    async with AsyncClient("alice", port=50001) as client:
+        ns, ins = await asyncio.gather(
+            client.check_nameserver_status(),
+            client.check_instrumentserver_status(),
+        )
+"""
+
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from hwman.client.client import (
+    _GET_OBSERVABLES_REQUEST,
+    _HEALTH_CALLS,
+    _HEALTH_REQUEST,
+    _PING,
+    _ClientCertificates,
+    _circuit_request,
+    _circuit_result,
+    _grpc,
+    _join_stream,
+    _health_message,
+)
+from hwman.grpc.protobufs_compiled.test_pb2 import TestRequest, TestType  # type: ignore
+
+if TYPE_CHECKING:
+    import grpc.aio
+
+    from hwman.grpc.protobufs_compiled.health_pb2_grpc import HealthStub  # type: ignore
+    from hwman.grpc.protobufs_compiled.test_pb2_grpc import TestStub  # type: ignore
+    from hwman.grpc.protobufs_compiled.circuits_pb2_grpc import CircuitsStub  # type: ignore
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncClient(_ClientCertificates):
+    """Async counterpart of `Client`; call (and await) `initialize()` before use."""
+
+    def __init__(
+        self,
+        name: str = "default",
+        address: str = "localhost",
+        port: int = 50222,
+        clients_cert_dir: str | Path = "./certs/clients",
+        ca_cert_path: str | Path = "./certs/ca.crt",
+    ):
+        """Same connection arguments as `Client`."""
+        self.health_stub: HealthStub | None = None
+        self.test_stub: TestStub | None = None
+        self.circuits_stub: CircuitsStub | None = None
+        self.channel: grpc.aio.Channel | None = None
+
+        self._init_connection(
+            name, address, port, clients_cert_dir, ca_cert_path
+        )
+
+    async def initialize(self) -> None:
+        """Open the channel. Must run inside the event loop that will use it."""
+        from hwman.grpc.protobufs_compiled.health_pb2_grpc import HealthStub  # type: ignore
+        from hwman.grpc.protobufs_compiled.test_pb2_grpc import TestStub  # type: ignore
+        from hwman.grpc.protobufs_compiled.circuits_pb2_grpc import CircuitsStub  # type: ignore
+
+        logger.info(
+            "Initializing %s async secure channel to %s", self.name, self.target
+        )
+
+        credentials, options = self._channel_credentials()
+        self.channel = _grpc().aio.secure_channel(self.target, credentials, options=options)
+
+        self.health_stub = HealthStub(self.channel)
+        self.test_stub = TestStub(self.channel)
+        self.circuits_stub = CircuitsStub(self.channel)
+
+    async def close(self) -> None:
+        if self.channel is not None:
+            await self.channel.close()
+            self.channel = None
+            self.health_stub = self.test_stub = self.circuits_stub = None
+
+    async def __aenter__(self) -> "AsyncClient":
+        await self.initialize()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def ping_server(self) -> str | None:
+        try:
+            assert self.health_stub is not None, "Health stub is not initialized"
+            response = await self.health_stub.TestPing(_PING)
+            return response.message
+        except _grpc().RpcError as e:
+            logger.error("Failed to ping server: %s", e)
+            return None
+
+    async def _health_call(self, call: str) -> str | None:
+        """Async version of `Client._health_call`."""
+        method, success_msg, failure_msg, action = _HEALTH_CALLS[call]
+        try:
+            assert self.health_stub is not None, "Health stub is not initialized"
+            response = await getattr(self.health_stub, method)(_HEALTH_REQUEST)
+            return _health_message(response, success_msg, failure_msg)
+        except _grpc().RpcError as e:
+            logger.error("Failed to %s: %s", action, e)
+            return None
+
+    async def check_instrumentserver_status(self) -> str | None:
+        return await self._health_call("check_instrumentserver_status")
+
+    async def start_instrumentserver(self) -> str | None:
+        return await self._health_call("start_instrumentserver")
+
+    async def stop_instrumentserver(self) -> str | None:
+        return await self._health_call("stop_instrumentserver")
+
+    async def start_nameserver(self) -> str | None:
+        return await self._health_call("start_nameserver")
+
+    async def stop_nameserver(self) -> str | None:
+        return await self._health_call("stop_nameserver")
+
+    async def check_nameserver_status(self) -> str | None:
+        return await self._health_call("check_nameserver_status")
+
+    async def start_test(self, test_type: TestType, pid: str) -> str | None:
+        try:
+            assert self.test_stub is not None, "Test stub is not initialized"
+            await self.test_stub.StandardTest(TestRequest(test_type=test_type, pid=pid))
+            return None
+        except _grpc().RpcError as e:
+            logger.error("Failed to start test: %s", e)
+            return None
+
+    async def get_observables(self):
+        try:
+            assert self.test_stub is not None, "Test stub is not initialized"
+            return await self.test_stub.GetObservables(_GET_OBSERVABLES_REQUEST)
+        except _grpc().RpcError as e:
+            logger.error("Failed to get observables: %s", e)
+            return None
+
+    async def run_circuit(
+        self,
+        gates: list[dict],
+        shots: int,
+        pid: str = "",
+        packed: bool = False,
+        stream: bool = False,
+    ) -> dict | None:
+        """Execute a quantum circuit on the QPU; see `Client.run_circuit`."""
+        try:
+            assert self.circuits_stub is not None, "Circuits stub is not initialized"
+            request = _circuit_request(gates, shots, pid, packed)
+            if stream:
+                call = self.circuits_stub.RunCircuitStream(request)
+                response = _join_stream([chunk async for chunk in call], packed)
+            else:
+                response = await self.circuits_stub.RunCircuit(request)
+            return _circuit_result(response, packed)
+        except _grpc().RpcError as e:
+            logger.error("Failed to run circuit: %s", e)
+            return None
@@ -1,53 +1,263 @@
+import atexit
+import itertools
 import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from functools import lru_cache
 from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Iterable, NamedTuple
 
-import grpc
-
-from hwman.grpc.protobufs_compiled.health_pb2_grpc import HealthStub  # type: ignore
 from hwman.grpc.protobufs_compiled.health_pb2 import Ping, HealthRequest  # type: ignore
-from hwman.grpc.protobufs_compiled.test_pb2_grpc import TestStub  # type: ignore
 from hwman.grpc.protobufs_compiled.test_pb2 import TestRequest, TestType, GetObservablesRequest  # type: ignore
-from hwman.grpc.protobufs_compiled.circuits_pb2_grpc import CircuitsStub  # type: ignore
-from hwman.grpc.protobufs_compiled.circuits_pb2 import RunCircuitRequest, RunCircuitResponse, Gate  # type: ignore
+from hwman.grpc.protobufs_compiled.circuits_pb2 import RunCircuitRequest, RunCircuitResponse, RunCircuitsRequest, Gate  # type: ignore
+
+# grpc is loaded through _grpc() and the *_pb2_grpc stub modules are imported
+# where they are used, so that importing the client (e.g. for TestType) does not
+# load the gRPC runtime.
+if TYPE_CHECKING:
+    import grpc
+
+    from hwman.grpc.protobufs_compiled.health_pb2_grpc import HealthStub  # type: ignore
+    from hwman.grpc.protobufs_compiled.test_pb2_grpc import TestStub  # type: ignore
+    from hwman.grpc.protobufs_compiled.circuits_pb2_grpc import CircuitsStub  # type: ignore
 
 
 logger = logging.getLogger(__name__)
 
 
-class Client:
-    def __init__(
+def _grpc() -> ModuleType:
+    """Import and return the grpc module on first use (see the note above)."""
+    import grpc
+
+    return grpc
+
+
+@lru_cache(maxsize=32)
+def _cached_read(path_str: str, mtime_ns: int) -> bytes:
+    """Read a certificate file, cached per (path, mtime) across Client instances.
+
+    Not used for private keys, which are not kept in a process-wide cache.
+    """
+    return Path(path_str).read_bytes()
+
+
+# Constant request messages, built once and never mutated
+_PING = Ping(message="Ping from client")
+_HEALTH_REQUEST = HealthRequest()
+_GET_OBSERVABLES_REQUEST = GetObservablesRequest()
+
+
+# Keepalive pings keep idle channels to the server from being silently dropped.
+# Pings are allowed without intervening data so they continue during long
+# circuit runs (the server accepts them at this rate, see hwman.main).
+CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.http2.max_pings_without_data", 0),
+]
+
+
+@lru_cache(maxsize=None)
+def _ssl_session_cache() -> Any:
+    """Process-wide TLS session cache, so reconnects resume instead of fully handshaking."""
+    from grpc.experimental import session_cache
+
+    return session_cache.ssl_session_cache_lru(64)
+
+
+# Health RPCs that take a HealthRequest, by client method name:
+# (RPC name, success message, failure message, action for error logs).
+_HEALTH_CALLS = {
+    "check_instrumentserver_status": (
+        "GetInstrumentServerStatus",
+        "Instrumentserver is running",
+        "Instrumentserver is not running",
+        "check instrumentserver status",
+    ),
+    "start_instrumentserver": (
+        "StartInstrumentServer",
+        "Instrumentserver started successfully",
+        "Failed to start instrumentserver",
+        "start instrumentserver",
+    ),
+    "stop_instrumentserver": (
+        "StopInstrumentServer",
+        "Instrumentserver stopped successfully",
+        "Failed to stop instrumentserver",
+        "stop instrumentserver",
+    ),
+    "start_nameserver": (
+        "StartPyroNameserver",
+        "Nameserver started successfully",
+        "Failed to start nameserver",
+        "start nameserver",
+    ),
+    "stop_nameserver": (
+        "StopPyroNameserver",
+        "Nameserver stopped successfully",
+        "Failed to stop nameserver",
+        "stop nameserver",
+    ),
+    "check_nameserver_status": (
+        "GetPyroNameserverStatus",
+        "Nameserver is running",
+        "Nameserver is not running",
+        "check nameserver status",
+    ),
+}
+
+
+def _health_message(response: Any, success_msg: str, failure_msg: str) -> str:
+    """Describe an InstrumentServerResponse the way the client methods report it."""
+    if response.success:
+        return f"{success_msg}: {response.is_running}, Message: {response.message}"
+    return f"{failure_msg}, Message: {response.message}"
+
+
+def _circuit_request(
+    gates: list[dict], shots: int, pid: str, packed: bool
+) -> RunCircuitRequest:
+    """Build a RunCircuitRequest from gate dictionaries."""
+    # Convert gate dicts to proto Gate messages
+    proto_gates = [
+        Gate(
+            symbol=g["symbol"],
+            target_qubits=g.get("target_qubits", []),
+            control_qubits=g.get("control_qubits", []),
+            params=g.get("params", []),
+        )
+        for g in gates
+    ]
+
+    return RunCircuitRequest(
+        pid=pid,
+        gates=proto_gates,
+        shots=shots,
+        packed_bitstream=packed,
+    )
+
+
+def _join_stream(
+    responses: Iterable[RunCircuitResponse], packed: bool
+) -> RunCircuitResponse:
+    """Reassemble a RunCircuitStream reply into a single RunCircuitResponse."""
+    chunks = iter(responses)
+    response = next(chunks)
+    if packed:
+        response.packed_bitstream = b"".join(
+            [response.packed_bitstream, *(c.packed_bitstream for c in chunks)]
+        )
+    else:
+        for chunk in chunks:
+            response.raw_bitstream.extend(chunk.raw_bitstream)
+    return response
+
+
+def _circuit_result(response: RunCircuitResponse, packed: bool) -> dict | None:
+    """Convert a RunCircuitResponse into the dict returned by run_circuit."""
+    if not response.success:
+        logger.error("Circuit execution failed: %s", response.message)
+        return None
+
+    distribution = {entry.bitstring: entry.count for entry in response.distribution}
+    raw_bitstream: Any
+    if packed:
+        # Only packed results need numpy; keep it out of the client import.
+        import numpy as np
+
+        n_qubits = len(next(iter(distribution), ""))
+        raw_bitstream = np.frombuffer(
+            response.packed_bitstream, dtype=np.uint8
+        ).reshape(-1, max(n_qubits, 1))
+    else:
+        raw_bitstream = list(response.raw_bitstream)
+
+    return {
+        "distribution": distribution,
+        "raw_bitstream": raw_bitstream,
+    }
+
+
+class _SharedChannel(NamedTuple):
+    credentials: "grpc.ChannelCredentials"
+    channel: "grpc.Channel"
+    health_stub: "HealthStub"
+    test_stub: "TestStub"
+    circuits_stub: "CircuitsStub"
+
+
+# Clients with the same target and credentials share one channel (and so one
+# TCP/TLS connection) and its stubs, which are thread-safe. Credentials are
+# identified by certificate file paths and mtimes, never by key bytes.
+_CHANNEL_CACHE: dict[tuple[Any, ...], _SharedChannel] = {}
+_CHANNEL_CACHE_LOCK = threading.Lock()
+
+
+@atexit.register
+def _close_shared_channels() -> None:
+    """Close every cached channel so connections are shut down cleanly at exit."""
+    with _CHANNEL_CACHE_LOCK:
+        for shared in _CHANNEL_CACHE.values():
+            shared.channel.close()
+        _CHANNEL_CACHE.clear()
+
+
+class _ClientCertificates:
+    """Target and mTLS credential handling shared by Client and AsyncClient.
+
+    Subclasses call ``_init_connection`` from ``__init__`` and build their
+    channel from ``target`` and ``_channel_credentials``; only the RPC wrappers
+    differ between the two clients.
+    """
+
+    name: str
+    address: str
+    port: int
+    target: str
+    ca_cert_path: Path
+    client_cert_path: Path
+    client_key_path: Path
+    ca_cert: bytes | None
+    client_cert: bytes | None
+    client_key: bytes | None
+    cert_files: tuple[tuple[str, int], ...] = ()
+
+    def _init_connection(
         self,
-        name: str = "default",
-        address: str = "localhost",
-        port: int = 50222,
-        clients_cert_dir: str | Path = "./certs/clients",
-        ca_cert_path: str | Path = "./certs/ca.crt",
-        initialize_at_start: bool = True,
-    ):
+        name: str,
+        address: str,
+        port: int,
+        clients_cert_dir: str | Path,
+        ca_cert_path: str | Path,
+    ) -> None:
+        """Set the target and certificate paths, and load the certificates."""
         self.name = name
         self.address = address
         self.port = port
+        self.target = f"{address}:{port}"
 
         self.ca_cert_path = Path(ca_cert_path)
 
         self.client_cert_path = Path(clients_cert_dir) / f"{name}.crt"
         self.client_key_path = Path(clients_cert_dir) / f"{name}.key"
 
-        self.ca_cert: bytes | None = None
-        self.client_cert: bytes | None = None
-        self.client_key: bytes | None = None
-
-        self.health_stub: HealthStub | None = None
-        self.test_stub: TestStub | None = None
-        self.circuits_stub: CircuitsStub | None = None
+        self.ca_cert = None
+        self.client_cert = None
+        self.client_key = None
 
         self._initialize_certificates()
 
-        # Initialize the channel
-        self.channel = None
-        self.credentials = None
-        if initialize_at_start:
-            self.initialize()
+    def _channel_credentials(self) -> tuple["grpc.ChannelCredentials", list[tuple[str, Any]]]:
+        """mTLS credentials and channel options for `target`."""
+        credentials = _grpc().ssl_channel_credentials(
+            root_certificates=self.ca_cert,
+            private_key=self.client_key,
+            certificate_chain=self.client_cert,
+        )
+        return credentials, [*CHANNEL_OPTIONS, ("grpc.ssl_session_cache", _ssl_session_cache())]
 
     def _initialize_certificates(self) -> None:
         """
@@ -60,20 +270,23 @@ class Client:
 
         Note: Client certificates must be pre-generated on the hwman server and
         distributed to clients. The CA private key should never leave the server.
-        Use `CertificateManager.create_client_certificate(name)` on the server
-        to generate client certificates.
+        Generate them with `hwman cert create-client <name>` on the server; the
+        client never generates keys itself, so constructing it stays cheap.
         """
-        # Check all required files exist before loading any
+        # Stat each required file once: the mtimes key the read cache, and a
+        # failed stat means the file is missing. Check all before loading any.
+        files = (
+            ("CA certificate", self.ca_cert_path),
+            ("Client certificate", self.client_cert_path),
+            ("Client key", self.client_key_path),
+        )
         missing_files = []
-
-        if not self.ca_cert_path.exists():
-            missing_files.append(f"CA certificate: {self.ca_cert_path}")
-
-        if not self.client_cert_path.exists():
-            missing_files.append(f"Client certificate: {self.client_cert_path}")
-
-        if not self.client_key_path.exists():
-            missing_files.append(f"Client key: {self.client_key_path}")
+        mtimes = []
+        for label, path in files:
+            try:
+                mtimes.append(path.stat().st_mtime_ns)
+            except FileNotFoundError:
+                missing_files.append(f"{label}: {path}")
 
         if missing_files:
             error_msg = (
@@ -81,56 +294,145 @@ class Client:
                 + "\n".join(f"  - {f}" for f in missing_files)
                 + "\n\nClient certificates must be generated on the hwman server "
                 "and copied to the client. On the server, run:\n"
-                f"  CertificateManager(cert_dir).create_client_certificate('{self.name}')\n"
+                f"  uv run hwman cert create-client {self.name}\n"
                 "Then copy ca.crt and the client cert/key files to the client machine."
             )
             logger.error(error_msg)
             raise FileNotFoundError(error_msg)
 
-        # Load the certificates
-        with open(self.ca_cert_path, "rb") as f:
-            self.ca_cert = f.read()
-        logger.debug(f"Loaded CA certificate from {self.ca_cert_path}")
+        # Load the certificates. The private key is read directly rather than
+        # through the cache, so its bytes are not kept alive for the process.
+        self.ca_cert = _cached_read(str(self.ca_cert_path), mtimes[0])
+        self.client_cert = _cached_read(str(self.client_cert_path), mtimes[1])
+        self.client_key = self.client_key_path.read_bytes()
+        # (path, mtime) of each file, used to key shared channels without
+        # holding the key material itself.
+        self.cert_files = tuple(
+            (str(path), mtime) for (_, path), mtime in zip(files, mtimes)
+        )
+        logger.debug(
+            "Loaded CA certificate, client certificate and key from %s, %s, %s",
+            self.ca_cert_path,
+            self.client_cert_path,
+            self.client_key_path,
+        )
 
-        with open(self.client_cert_path, "rb") as f:
-            self.client_cert = f.read()
-        logger.debug(f"Loaded client certificate from {self.client_cert_path}")
+        logger.info("Successfully loaded certificates for client '%s'", self.name)
 
-        with open(self.client_key_path, "rb") as f:
-            self.client_key = f.read()
-        logger.debug(f"Loaded client key from {self.client_key_path}")
 
-        logger.info(f"Successfully loaded certificates for client '{self.name}'")
+class Client(_ClientCertificates):
+    def __init__(
+        self,
+        name: str = "default",
+        address: str = "localhost",
+        port: int = 50222,
+        clients_cert_dir: str | Path = "./certs/clients",
+        ca_cert_path: str | Path = "./certs/ca.crt",
+        initialize_at_start: bool = True,
+        connect_timeout: float | None = None,
+        channel_index: int = 0,
+    ):
+        """
+        Connect to the hwman server over mTLS at `address`:`port`.
 
-    def initialize(self) -> None:
-        logger.info(
-            f"Initializing {self.name} secure channel to {self.address}:{self.port}"
-        )
+        Channels are shared per target and credentials for the life of the
+        process. If `connect_timeout` is set, the first `initialize()` that
+        creates a channel waits up to that many seconds for it to connect, so
+        the TLS handshake happens up front rather than on the first call.
 
-        self.credentials = grpc.ssl_channel_credentials(
-            root_certificates=self.ca_cert,
-            private_key=self.client_key,
-            certificate_chain=self.client_cert,
-        )
+        Clients with different `channel_index` values get separate channels on
+        separate connections; see `ClientPool`.
+        """
+        self.connect_timeout = connect_timeout
+        self.channel_index = channel_index
 
-        self.channel = grpc.secure_channel(
-            f"{self.address}:{self.port}", self.credentials
-        )
-        logger.info(
-            f"Secure channel initialized for {self.name} to {self.address}:{self.port}"
+        self.health_stub: HealthStub | None = None
+        self.test_stub: TestStub | None = None
+        self.circuits_stub: CircuitsStub | None = None
+
+        self._init_connection(
+            name, address, port, clients_cert_dir, ca_cert_path
         )
 
-        self.health_stub = HealthStub(self.channel)
-        self.test_stub = TestStub(self.channel)
-        self.circuits_stub = CircuitsStub(self.channel)
+        # Initialize the channel
+        self.channel = None
+        self.credentials = None
+        if initialize_at_start:
+            self.initialize()
+
+    def initialize(self) -> None:
+        from hwman.grpc.protobufs_compiled.health_pb2_grpc import HealthStub  # type: ignore
+        from hwman.grpc.protobufs_compiled.test_pb2_grpc import TestStub  # type: ignore
+        from hwman.grpc.protobufs_compiled.circuits_pb2_grpc import CircuitsStub  # type: ignore
+
+        logger.info("Initializing %s secure channel to %s", self.name, self.target)
+
+        key = (self.target, self.cert_files, self.channel_index)
+        created = False
+        with _CHANNEL_CACHE_LOCK:
+            shared = _CHANNEL_CACHE.get(key)
+            if shared is None:
+                created = True
+                credentials, options = self._channel_credentials()
+                if self.channel_index:
+                    # Without a private subchannel pool gRPC would hand this
+                    # channel the same connection as index 0.
+                    options = [*options, ("grpc.use_local_subchannel_pool", 1)]
+                channel = _grpc().secure_channel(self.target, credentials, options=options)
+                shared = _CHANNEL_CACHE[key] = _SharedChannel(
+                    credentials,
+                    channel,
+                    HealthStub(channel),
+                    TestStub(channel),
+                    CircuitsStub(channel),
+                )
+                logger.info(
+                    "Secure channel initialized for %s to %s", self.name, self.target
+                )
+            else:
+                logger.info(
+                    "Reusing secure channel to %s for %s", self.target, self.name
+                )
+
+        if created and self.connect_timeout is not None:
+            try:
+                _grpc().channel_ready_future(shared.channel).result(
+                    timeout=self.connect_timeout
+                )
+            except _grpc().FutureTimeoutError:
+                logger.warning(
+                    "Channel to %s not ready after %ss", self.target, self.connect_timeout
+                )
+
+        self.credentials = shared.credentials
+        self.channel = shared.channel
+        self.health_stub = shared.health_stub
+        self.test_stub = shared.test_stub
+        self.circuits_stub = shared.circuits_stub
 
     def ping_server(self) -> str | None:
         try:
             assert self.health_stub is not None, "Health stub is not initialized"
-            response = self.health_stub.TestPing(Ping(message="Ping from client"))
+            response = self.health_stub.TestPing(_PING)
             return response.message
-        except grpc.RpcError as e:
-            logger.error(f"Failed to ping server: {e}")
+        except _grpc().RpcError as e:
+            logger.error("Failed to ping server: %s", e)
+            return None
+
+    def _health_call(self, call: str) -> str | None:
+        """Make the Health RPC listed under `call` in _HEALTH_CALLS and describe the result.
+
+        Returns "<success_msg>: <is_running>, Message: ..." on success,
+        "<failure_msg>, Message: ..." when the server reports failure, and None
+        (after logging "Failed to <action>") if the RPC itself fails.
+        """
+        method, success_msg, failure_msg, action = _HEALTH_CALLS[call]
+        try:
+            assert self.health_stub is not None, "Health stub is not initialized"
+            response = getattr(self.health_stub, method)(_HEALTH_REQUEST)
+            return _health_message(response, success_msg, failure_msg)
+        except _grpc().RpcError as e:
+            logger.error("Failed to %s: %s", action, e)
             return None
 
     def check_instrumentserver_status(self) -> str | None:
@@ -138,96 +440,42 @@ class Client:
         Check the status of the instrumentserver.
         This method should be implemented to interact with the instrumentserver.
         """
-        try:
-            assert self.health_stub is not None, "Health stub is not initialized"
-            response = self.health_stub.GetInstrumentServerStatus(HealthRequest())
-            if response.success:
-                return f"Instrumentserver is running: {response.is_running}, Message: {response.message}"
-            else:
-                return f"Instrumentserver is not running, Message: {response.message}"
-        except grpc.RpcError as e:
-            logger.error(f"Failed to check instrumentserver status: {e}")
-            return None
+        return self._health_call("check_instrumentserver_status")
 
     def start_instrumentserver(self) -> str | None:
         """
         Start the instrumentserver.
         This method should be implemented to interact with the instrumentserver.
         """
-        try:
-            assert self.health_stub is not None, "Health stub is not initialized"
-            response = self.health_stub.StartInstrumentServer(HealthRequest())
-            if response.success:
-                return f"Instrumentserver started successfully: {response.is_running}, Message: {response.message}"
-            else:
-                return f"Failed to start instrumentserver, Message: {response.message}"
-        except grpc.RpcError as e:
-            logger.error(f"Failed to start instrumentserver: {e}")
-            return None
+        return self._health_call("start_instrumentserver")
 
     def stop_instrumentserver(self) -> str | None:
         """
         Stop the instrumentserver.
         This method should be implemented to interact with the instrumentserver.
         """
-        try:
-            assert self.health_stub is not None, "Health stub is not initialized"
-            response = self.health_stub.StopInstrumentServer(HealthRequest())
-            if response.success:
-                return f"Instrumentserver stopped successfully: {response.is_running}, Message: {response.message}"
-            else:
-                return f"Failed to stop instrumentserver, Message: {response.message}"
-        except grpc.RpcError as e:
-            logger.error(f"Failed to stop instrumentserver: {e}")
-            return None
+        return self._health_call("stop_instrumentserver")
 
     def start_nameserver(self) -> str | None:
         """
         Start the nameserver.
         This method should be implemented to interact with the nameserver.
         """
-        try:
-            assert self.health_stub is not None, "Health stub is not initialized"
-            response = self.health_stub.StartPyroNameserver(HealthRequest())
-            if response.success:
-                return f"Nameserver started successfully: {response.is_running}, Message: {response.message}"
-            else:
-                return f"Failed to start nameserver, Message: {response.message}"
-        except grpc.RpcError as e:
-            logger.error(f"Failed to start nameserver: {e}")
-            return None
+        return self._health_call("start_nameserver")
 
     def stop_nameserver(self) -> str | None:
         """
         Stop the nameserver.
         This method should be implemented to interact with the nameserver.
         """
-        try:
-            assert self.health_stub is not None, "Health stub is not initialized"
-            response = self.health_stub.StopPyroNameserver(HealthRequest())
-            if response.success:
-                return f"Nameserver stopped successfully: {response.is_running}, Message: {response.message}"
-            else:
-                return f"Failed to stop nameserver, Message: {response.message}"
-        except grpc.RpcError as e:
-            logger.error(f"Failed to stop nameserver: {e}")
-            return None
+        return self._health_call("stop_nameserver")
 
     def check_nameserver_status(self) -> str | None:
         """
         Check the status of the nameserver.
         This method should be implemented to interact with the nameserver.
         """
-        try:
-            assert self.health_stub is not None, "Health stub is not initialized"
-            response = self.health_stub.GetPyroNameserverStatus(HealthRequest())
-            if response.success:
-                return f"Nameserver is running: {response.is_running}, Message: {response.message}"
-            else:
-                return f"Nameserver is not running, Message: {response.message}"
-        except grpc.RpcError as e:
-            logger.error(f"Failed to check nameserver status: {e}")
-            return None
+        return self._health_call("check_nameserver_status")
 
     def start_test(self, test_type: TestType, pid: str) -> str | None:
         try:
@@ -236,8 +484,8 @@ class Client:
                 TestRequest(test_type=test_type, pid=pid)
             )
             return None
-        except grpc.RpcError as e:
-            logger.error(f"Failed to start test: {e}")
+        except _grpc().RpcError as e:
+            logger.error("Failed to start test: %s", e)
             return None
 
     def start_res_spec(self, save_to_file: bool = True) -> str | None:
@@ -247,8 +495,8 @@ class Client:
                 TestRequest(save_to_file=save_to_file)
             )
             return ret
-        except grpc.RpcError as e:
-            logger.error(f"Failed to start test: {e}")
+        except _grpc().RpcError as e:
+            logger.error("Failed to start test: %s", e)
             return None
 
     def start_res_spec_vs_gain(self, save_to_file: bool = True) -> str | None:
@@ -258,8 +506,8 @@ class Client:
                 TestRequest(save_to_file=save_to_file)
             )
             return ret
-        except grpc.RpcError as e:
-            logger.error(f"Failed to start test: {e}")
+        except _grpc().RpcError as e:
+            logger.error("Failed to start test: %s", e)
             return None
 
     def start_sat_spec(self, save_to_file: bool = True) -> str | None:
@@ -269,8 +517,8 @@ class Client:
                 TestRequest(save_to_file=save_to_file)
             )
             return ret
-        except grpc.RpcError as e:
-            logger.error(f"Failed to start test: {e}")
+        except _grpc().RpcError as e:
+            logger.error("Failed to start test: %s", e)
             return None
 
     def start_power_rabi(self, save_to_file: bool = True) -> str | None:
@@ -280,8 +528,8 @@ class Client:
                 TestRequest(save_to_file=save_to_file)
             )
             return ret
-        except grpc.RpcError as e:
-            logger.error(f"Failed to start test: {e}")
+        except _grpc().RpcError as e:
+            logger.error("Failed to start test: %s", e)
             return None
 
     def start_pi_spec(self, save_to_file: bool = True) -> str | None:
@@ -291,8 +539,8 @@ class Client:
                 TestRequest(save_to_file=save_to_file)
             )
             return ret
-        except grpc.RpcError as e:
-            logger.error(f"Failed to start test: {e}")
+        except _grpc().RpcError as e:
+            logger.error("Failed to start test: %s", e)
 
     def start_res_spec_after_pi(self, save_to_file: bool = True) -> str | None:
         try:
@@ -301,8 +549,8 @@ class Client:
                 TestRequest(save_to_file=save_to_file)
             )
             return ret
-        except grpc.RpcError as e:
-            logger.error(f"Failed to start test: {e}")
+        except _grpc().RpcError as e:
+            logger.error("Failed to start test: %s", e)
 
     def start_t1(self, save_to_file: bool = True) -> str | None:
         try:
@@ -311,8 +559,8 @@ class Client:
                 TestRequest(save_to_file=save_to_file)
             )
             return ret
-        except grpc.RpcError as e:
-            logger.error(f"Failed to start test: {e}")
+        except _grpc().RpcError as e:
+            logger.error("Failed to start test: %s", e)
 
     def start_t2r(self, save_to_file: bool = True) -> str | None:
         try:
@@ -321,8 +569,8 @@ class Client:
                 TestRequest(save_to_file=save_to_file)
             )
             return ret
-        except grpc.RpcError as e:
-            logger.error(f"Failed to start test: {e}")
+        except _grpc().RpcError as e:
+            logger.error("Failed to start test: %s", e)
 
     def start_t2e(self, save_to_file: bool = True) -> str | None:
         try:
@@ -331,8 +579,8 @@ class Client:
                 TestRequest(save_to_file=save_to_file)
             )
             return ret
-        except grpc.RpcError as e:
-            logger.error(f"Failed to start test: {e}")
+        except _grpc().RpcError as e:
+            logger.error("Failed to start test: %s", e)
 
     def start_ro_cal(self, save_to_file: bool = True) -> str | None:
         try:
@@ -341,8 +589,8 @@ class Client:
                 TestRequest(save_to_file=save_to_file)
             )
             return ret
-        except grpc.RpcError as e:
-            logger.error(f"Failed to start test: {e}")
+        except _grpc().RpcError as e:
+            logger.error("Failed to start test: %s", e)
 
     def start_tuneup_protocol(self, save_to_file: bool = True):
         try:
@@ -351,15 +599,15 @@ class Client:
                 TestRequest(save_to_file=save_to_file)
             )
             return ret
-        except grpc.RpcError as e:
-            logger.error(f"Failed to start test: {e}")
+        except _grpc().RpcError as e:
+            logger.error("Failed to start test: %s", e)
 
     def get_observables(self):
         try:
             assert self.test_stub is not None, "Test stub is not initialized"
-            return self.test_stub.GetObservables(GetObservablesRequest())
-        except grpc.RpcError as e:
-            logger.error(f"Failed to get observables: {e}")
+            return self.test_stub.GetObservables(_GET_OBSERVABLES_REQUEST)
+        except _grpc().RpcError as e:
+            logger.error("Failed to get observables: %s", e)
             return None
 
     def measure_observables(self, save_to_file: bool = True):
@@ -369,14 +617,16 @@ class Client:
                 TestRequest(save_to_file=save_to_file)
             )
             return ret
-        except grpc.RpcError as e:
-            logger.error(f"Failed to measure observables: {e}")
+        except _grpc().RpcError as e:
+            logger.error("Failed to measure observables: %s", e)
 
     def run_circuit(
         self,
         gates: list[dict],
         shots: int,
         pid: str = "",
+        packed: bool = False,
+        stream: bool = False,
     ) -> dict | None:
         """
         Execute a quantum circuit on the QPU.
@@ -389,9 +639,15 @@ class Client:
                 - params: List of gate parameters (optional)
             shots: Number of measurement shots
             pid: Optional process/job ID for tracking
+            packed: If True, the server sends per-shot results as packed bytes and
+                "raw_bitstream" is a (shots, n_qubits) uint8 array of 0/1 labels
+                instead of a list of strings
+            stream: If True, use RunCircuitStream so large per-shot results arrive
+                in chunks instead of one message; the returned dict is the same
 
         Returns:
-            Dictionary mapping bitstring outcomes to counts, or None on error
+            Dictionary with the bitstring "distribution" and per-shot "raw_bitstream",
+            or None on error
 
         Example:
             >>> gates = [
@@ -404,37 +660,166 @@ class Client:
         try:
             assert self.circuits_stub is not None, "Circuits stub is not initialized"
 
-            # Convert gate dicts to proto Gate messages
-            proto_gates = [
-                Gate(
-                    symbol=g["symbol"],
-                    target_qubits=g.get("target_qubits", []),
-                    control_qubits=g.get("control_qubits", []),
-                    params=g.get("params", []),
+            request = _circuit_request(gates, shots, pid, packed)
+            response: RunCircuitResponse
+            if stream:
+                response = _join_stream(
+                    self.circuits_stub.RunCircuitStream(request), packed
                 )
-                for g in gates
-            ]
+            else:
+                response = self.circuits_stub.RunCircuit(request)
+            return _circuit_result(response, packed)
 
-            request = RunCircuitRequest(
-                pid=pid,
-                gates=proto_gates,
-                shots=shots,
-            )
+        except _grpc().RpcError as e:
+            logger.error("Failed to run circuit: %s", e)
+            return None
+
+
+class ClientPool:
+    """
+    Round-robin over `size` Clients, each on its own TCP/TLS connection.
+
+    A single HTTP/2 connection shares one flow-control window and congestion
+    window between all its streams, which caps throughput when many threads
+    run circuits at once. Spreading calls over a few connections avoids that:
+
+        pool = ClientPool(4, name="alice", port=50001)
+        with ThreadPoolExecutor(16) as ex:
+            results = list(ex.map(lambda g: pool.next().run_circuit(g, 1000), circuits))
 
-            response: RunCircuitResponse = self.circuits_stub.RunCircuit(request)
+    Keyword arguments are passed to every `Client`.
+    """
 
-            if not response.success:
-                logger.error(f"Circuit execution failed: {response.message}")
-                return None
+    def __init__(self, size: int = 4, **client_kwargs: Any):
+        if size < 1:
+            raise ValueError(f"size must be at least 1, got {size}")
+        self.clients = [
+            Client(**client_kwargs, channel_index=i) for i in range(size)
+        ]
+        self._cycle = itertools.cycle(self.clients)
+        self._lock = threading.Lock()
 
-            return {
-                "distribution": {
-                    entry.bitstring: entry.count
-                    for entry in response.distribution
-                },
-                "raw_bitstream": list(response.raw_bitstream),
-            }
+    def next(self) -> Client:
+        """Return the next Client in round-robin order. Thread-safe."""
+        with self._lock:
+            return next(self._cycle)
 
-        except grpc.RpcError as e:
-            logger.error(f"Failed to run circuit: {e}")
-            return None
\ No newline at end of file
+
+class CircuitBatcher:
+    """
+    Coalesce `run_circuit` calls from many threads into batched RunCircuits RPCs.
+
+    `submit()` returns immediately with a Future. A background thread collects
+    submissions for up to `window` seconds (or until `max_batch` are queued) and
+    sends them in a single call, then resolves each Future with what
+    `Client.run_circuit` would have returned (a result dict, or None on error):
+
+        with CircuitBatcher(client) as batcher:
+            futures = [batcher.submit(gates, 1000) for gates in circuits]
+            results = [f.result() for f in futures]
+
+    Latency-sensitive callers can keep using `Client.run_circuit` directly.
+    """
+
+    def __init__(self, client: Client, max_batch: int = 32, window: float = 0.001):
+        self.client = client
+        self.max_batch = max_batch
+        self.window = window
+        self._queue: "queue.SimpleQueue[tuple[RunCircuitRequest, bool, Future] | None]" = (
+            queue.SimpleQueue()
+        )
+        self._closed = False
+        self._closed_lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run, name="hwman-circuit-batcher", daemon=True
+        )
+        self._thread.start()
+
+    def submit(
+        self, gates: list[dict], shots: int, pid: str = "", packed: bool = False
+    ) -> "Future[dict | None]":
+        """Queue a circuit; arguments are the same as `Client.run_circuit`.
+
+        Raises:
+            RuntimeError: If the batcher has been closed or its background
+                thread has stopped.
+        """
+        request = _circuit_request(gates, shots, pid, packed)
+        future: Future = Future()
+        with self._closed_lock:
+            if self._closed:
+                raise RuntimeError("CircuitBatcher is closed")
+            if not self._thread.is_alive():
+                raise RuntimeError("CircuitBatcher background thread has stopped")
+            self._queue.put((request, packed, future))
+        return future
+
+    def close(self) -> None:
+        """Send whatever is still queued and stop the background thread."""
+        with self._closed_lock:
+            if not self._closed:
+                self._closed = True
+                self._queue.put(None)
+        self._thread.join()
+
+    def __enter__(self) -> "CircuitBatcher":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.window
+            while len(batch) < self.max_batch:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            # Futures cancelled while queued are dropped rather than sent.
+            batch = [item for item in batch if item[2].set_running_or_notify_cancel()]
+            if batch:
+                self._send(batch)
+
+    def _send(self, batch: list[tuple[RunCircuitRequest, bool, Future]]) -> None:
+        try:
+            assert self.client.circuits_stub is not None, "Circuits stub is not initialized"
+            response = self.client.circuits_stub.RunCircuits(
+                RunCircuitsRequest(circuits=[request for request, _, _ in batch])
+            )
+        except _grpc().RpcError as e:
+            logger.error("Failed to run circuit batch of %d: %s", len(batch), e)
+            for _, _, future in batch:
+                future.set_result(None)
+            return
+        except Exception as e:
+            for _, _, future in batch:
+                future.set_exception(e)
+            return
+
+        results = response.results
+        if len(results) != len(batch):
+            logger.error(
+                "RunCircuits returned %d results for %d circuits", len(results), len(batch)
+            )
+        for i, (_, packed, future) in enumerate(batch):
+            if i < len(results):
+                try:
+                    future.set_result(_circuit_result(results[i], packed))
+                except Exception as e:
+                    future.set_exception(e)
+            else:
+                future.set_exception(
+                    RuntimeError(
+                        f"RunCircuits returned {len(results)} results for {len(batch)} circuits"
+                    )
+                )
@@ -264,9 +264,22 @@ class QICKProgramGenerator:
 
         return "\n".join(lines)
 
-    def generate_program(self, class_name: str = "CompiledProgram") -> str:
+    def generate_header(self) -> str:
+        """Generate the module docstring naming the circuit's PID and shots."""
+        lines = []
+        lines.append('"""')
+        lines.append(f"Compiled QICK program generated from Circuit.")
+        lines.append(f"Circuit PID: {self.circuit.pid}")
+        lines.append(f"Shots: {self.circuit.shots}")
+        lines.append('"""')
+        return "\n".join(lines)
+
+    def generate_program_body(self, class_name: str = "CompiledProgram") -> str:
         """
-        Generate complete QICK program class code.
+        Generate the imports and QICK program class, without the header.
+
+        The body does not depend on the circuit's PID, so it is the same for
+        repeated runs of the same circuit and can be used as a cache key.
 
         Raises:
             UnsupportedGateError: If circuit contains unsupported gates
@@ -274,13 +287,10 @@ class QICKProgramGenerator:
         # Validate circuit before generating code
         self.validate()
 
+        # Start pulse numbering afresh so repeated calls give the same body
+        self.pulse_counter = 0
+
         lines = []
-        lines.append('"""')
-        lines.append(f"Compiled QICK program generated from Circuit.")
-        lines.append(f"Circuit PID: {self.circuit.pid}")
-        lines.append(f"Shots: {self.circuit.shots}")
-        lines.append('"""')
-        lines.append("")
         lines.append("import numpy as np")
         lines.append("from qick.asm_v2 import AveragerProgramV2")
         lines.append("from cqedtoolbox.instruments.qick.qick_sweep_v2 import QickBoardSweep, ComplexQICKData")
@@ -309,6 +319,16 @@ class QICKProgramGenerator:
 
         return "\n".join(lines)
 
+    def generate_program(self, class_name: str = "CompiledProgram") -> str:
+        """
+        Generate complete QICK program class code: header, then program body.
+
+        Raises:
+            UnsupportedGateError: If circuit contains unsupported gates
+        """
+        body = self.generate_program_body(class_name)
+        return f"{self.generate_header()}\n\n{body}"
+
 
 def compile_circuit_to_qick(circuit: Circuit, class_name: str = "CompiledProgram") -> str:
     """
@@ -2,8 +2,9 @@
 
 import logging
 from pathlib import Path
+from typing import Any
 
-from pydantic import Field, field_validator
+from pydantic import AliasChoices, Field, SecretStr, field_validator
 from pydantic_settings import (
     BaseSettings,
     PydanticBaseSettingsSource,
@@ -13,6 +14,24 @@ from pydantic_settings import (
 
 logger = logging.getLogger(__name__)
 
+VALID_LOG_LEVELS = frozenset(("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"))
+
+# Secrets that are only read from the environment, never from the TOML file
+_ENV_ONLY_SETTINGS = frozenset(("ca_key_password",))
+
+
+class _TomlSettingsSource(TomlConfigSettingsSource):
+    """TOML settings source that drops the environment-only settings."""
+
+    def __call__(self) -> dict[str, Any]:
+        data = super().__call__()
+        for name in _ENV_ONLY_SETTINGS & data.keys():
+            logger.warning(
+                f"Ignoring '{name}' in the config file; set it in the environment instead"
+            )
+            del data[name]
+        return data
+
 
 class HwmanSettings(BaseSettings):
     """Main configuration for hwman loaded from TOML file."""
@@ -25,6 +44,12 @@ class HwmanSettings(BaseSettings):
     # Server settings
     server_address: str = Field(default="localhost", description="Server address to bind to")
     server_port: int = Field(default=50001, description="Server port to bind to")
+    grpc_workers: int = Field(
+        default=0,
+        ge=0,
+        validation_alias=AliasChoices("grpc_workers", "HWMAN_GRPC_WORKERS"),
+        description="gRPC server worker threads (0: CPU count + 4, at most 32; env HWMAN_GRPC_WORKERS)",
+    )
     log_level: str = Field(
         default="INFO", description="Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)"
     )
@@ -33,6 +58,11 @@ class HwmanSettings(BaseSettings):
     cert_dir: Path = Field(
         default=Path("./certs"), description="Directory for certificates"
     )
+    ca_key_password: SecretStr = Field(
+        default=SecretStr(""),
+        validation_alias=AliasChoices("ca_key_password", "HWMAN_CA_KEY_PASSWORD"),
+        description="Password encrypting the CA private key (env HWMAN_CA_KEY_PASSWORD only; empty stores it unencrypted)",
+    )
 
     # InstrumentServer settings
     instrumentserver_config_file: Path = Field(
@@ -91,12 +121,12 @@ class HwmanSettings(BaseSettings):
     @classmethod
     def validate_log_level(cls, v: str) -> str:
         """Validate log level is a valid Python logging level."""
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if v.upper() not in valid_levels:
+        level = v.upper()
+        if level not in VALID_LOG_LEVELS:
             raise ValueError(
-                f"Invalid log level '{v}'. Must be one of: {', '.join(valid_levels)}"
+                f"Invalid log level '{v}'. Must be one of: {', '.join(sorted(VALID_LOG_LEVELS, key=logging.getLevelName))}"
             )
-        return v.upper()
+        return level
 
     @classmethod
     def settings_customise_sources(
@@ -121,7 +151,7 @@ class HwmanSettings(BaseSettings):
         # Only create TomlConfigSettingsSource if the file exists
         toml_source = None
         if Path(toml_path).exists():
-            toml_source = TomlConfigSettingsSource(settings_cls, str(toml_path))
+            toml_source = _TomlSettingsSource(settings_cls, str(toml_path))
 
         # Build sources in priority order (higher priority = checked first)
         sources: list[PydanticBaseSettingsSource] = [
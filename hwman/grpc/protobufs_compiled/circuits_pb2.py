@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n#hwman/grpc/protobufs/circuits.proto\x12\x05hwman\"U\n\x04Gate\x12\x0e\n\x06symbol\x18\x01 \x01(\t\x12\x15\n\rtarget_qubits\x18\x02 \x03(\x05\x12\x16\n\x0e\x63ontrol_qubits\x18\x03 \x03(\x05\x12\x0e\n\x06params\x18\x04 \x03(\x01\"K\n\x11RunCircuitRequest\x12\x0b\n\x03pid\x18\x01 \x01(\t\x12\x1a\n\x05gates\x18\x02 \x03(\x0b\x32\x0b.hwman.Gate\x12\r\n\x05shots\x18\x03 \x01(\x05\"5\n\x11\x44istributionEntry\x12\x11\n\tbitstring\x18\x01 \x01(\t\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"\x9d\x01\n\x12RunCircuitResponse\x12\x0b\n\x03pid\x18\x01 \x01(\t\x12\x0f\n\x07success\x18\x02 \x01(\x08\x12\x0f\n\x07message\x18\x03 \x01(\t\x12.\n\x0c\x64istribution\x18\x04 \x03(\x0b\x32\x18.hwman.DistributionEntry\x12\x11\n\tdata_path\x18\x05 \x01(\t\x12\x15\n\rraw_bitstream\x18\x06 \x03(\t2M\n\x08\x43ircuits\x12\x41\n\nRunCircuit\x12\x18.hwman.RunCircuitRequest\x1a\x19.hwman.RunCircuitResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n#hwman/grpc/protobufs/circuits.proto\x12\x05hwman\"U\n\x04Gate\x12\x0e\n\x06symbol\x18\x01 \x01(\t\x12\x15\n\rtarget_qubits\x18\x02 \x03(\x05\x12\x16\n\x0e\x63ontrol_qubits\x18\x03 \x03(\x05\x12\x0e\n\x06params\x18\x04 \x03(\x01\"e\n\x11RunCircuitRequest\x12\x0b\n\x03pid\x18\x01 \x01(\t\x12\x1a\n\x05gates\x18\x02 \x03(\x0b\x32\x0b.hwman.Gate\x12\r\n\x05shots\x18\x03 \x01(\x05\x12\x18\n\x10packed_bitstream\x18\x04 \x01(\x08\"5\n\x11\x44istributionEntry\x12\x11\n\tbitstring\x18\x01 \x01(\t\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"\xb7\x01\n\x12RunCircuitResponse\x12\x0b\n\x03pid\x18\x01 \x01(\t\x12\x0f\n\x07success\x18\x02 \x01(\x08\x12\x0f\n\x07message\x18\x03 \x01(\t\x12.\n\x0c\x64istribution\x18\x04 \x03(\x0b\x32\x18.hwman.DistributionEntry\x12\x11\n\tdata_path\x18\x05 \x01(\t\x12\x15\n\rraw_bitstream\x18\x06 \x03(\t\x12\x18\n\x10packed_bitstream\x18\x07 \x01(\x0c\"@\n\x12RunCircuitsRequest\x12*\n\x08\x63ircuits\x18\x01 \x03(\x0b\x32\x18.hwman.RunCircuitRequest\"A\n\x13RunCircuitsResponse\x12*\n\x07results\x18\x01 \x03(\x0b\x32\x19.hwman.RunCircuitResponse2\xde\x01\n\x08\x43ircuits\x12\x41\n\nRunCircuit\x12\x18.hwman.RunCircuitRequest\x1a\x19.hwman.RunCircuitResponse\x12I\n\x10RunCircuitStream\x12\x18.hwman.RunCircuitRequest\x1a\x19.hwman.RunCircuitResponse0\x01\x12\x44\n\x0bRunCircuits\x12\x19.hwman.RunCircuitsRequest\x1a\x1a.hwman.RunCircuitsResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -34,11 +34,15 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_GATE']._serialized_start=46
   _globals['_GATE']._serialized_end=131
   _globals['_RUNCIRCUITREQUEST']._serialized_start=133
-  _globals['_RUNCIRCUITREQUEST']._serialized_end=208
-  _globals['_DISTRIBUTIONENTRY']._serialized_start=210
-  _globals['_DISTRIBUTIONENTRY']._serialized_end=263
-  _globals['_RUNCIRCUITRESPONSE']._serialized_start=266
-  _globals['_RUNCIRCUITRESPONSE']._serialized_end=423
-  _globals['_CIRCUITS']._serialized_start=425
-  _globals['_CIRCUITS']._serialized_end=502
+  _globals['_RUNCIRCUITREQUEST']._serialized_end=234
+  _globals['_DISTRIBUTIONENTRY']._serialized_start=236
+  _globals['_DISTRIBUTIONENTRY']._serialized_end=289
+  _globals['_RUNCIRCUITRESPONSE']._serialized_start=292
+  _globals['_RUNCIRCUITRESPONSE']._serialized_end=475
+  _globals['_RUNCIRCUITSREQUEST']._serialized_start=477
+  _globals['_RUNCIRCUITSREQUEST']._serialized_end=541
+  _globals['_RUNCIRCUITSRESPONSE']._serialized_start=543
+  _globals['_RUNCIRCUITSRESPONSE']._serialized_end=608
+  _globals['_CIRCUITS']._serialized_start=611
+  _globals['_CIRCUITS']._serialized_end=833
 # @@protoc_insertion_point(module_scope)
@@ -40,6 +40,16 @@ class CircuitsStub(object):
                 request_serializer=hwman_dot_grpc_dot_protobufs_dot_circuits__pb2.RunCircuitRequest.SerializeToString,
                 response_deserializer=hwman_dot_grpc_dot_protobufs_dot_circuits__pb2.RunCircuitResponse.FromString,
                 _registered_method=True)
+        self.RunCircuitStream = channel.unary_stream(
+                '/hwman.Circuits/RunCircuitStream',
+                request_serializer=hwman_dot_grpc_dot_protobufs_dot_circuits__pb2.RunCircuitRequest.SerializeToString,
+                response_deserializer=hwman_dot_grpc_dot_protobufs_dot_circuits__pb2.RunCircuitResponse.FromString,
+                _registered_method=True)
+        self.RunCircuits = channel.unary_unary(
+                '/hwman.Circuits/RunCircuits',
+                request_serializer=hwman_dot_grpc_dot_protobufs_dot_circuits__pb2.RunCircuitsRequest.SerializeToString,
+                response_deserializer=hwman_dot_grpc_dot_protobufs_dot_circuits__pb2.RunCircuitsResponse.FromString,
+                _registered_method=True)
 
 
 class CircuitsServicer(object):
@@ -52,6 +62,21 @@ class CircuitsServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def RunCircuitStream(self, request, context):
+        """Same as RunCircuit, but per-shot results arrive in pieces: the first message
+        holds everything except raw_bitstream/packed_bitstream, and each following
+        message holds the next slice of shots. Concatenate them to rebuild the result.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def RunCircuits(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_CircuitsServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -60,6 +85,16 @@ def add_CircuitsServicer_to_server(servicer, server):
                     request_deserializer=hwman_dot_grpc_dot_protobufs_dot_circuits__pb2.RunCircuitRequest.FromString,
                     response_serializer=hwman_dot_grpc_dot_protobufs_dot_circuits__pb2.RunCircuitResponse.SerializeToString,
             ),
+            'RunCircuitStream': grpc.unary_stream_rpc_method_handler(
+                    servicer.RunCircuitStream,
+                    request_deserializer=hwman_dot_grpc_dot_protobufs_dot_circuits__pb2.RunCircuitRequest.FromString,
+                    response_serializer=hwman_dot_grpc_dot_protobufs_dot_circuits__pb2.RunCircuitResponse.SerializeToString,
+            ),
+            'RunCircuits': grpc.unary_unary_rpc_method_handler(
+                    servicer.RunCircuits,
+                    request_deserializer=hwman_dot_grpc_dot_protobufs_dot_circuits__pb2.RunCircuitsRequest.FromString,
+                    response_serializer=hwman_dot_grpc_dot_protobufs_dot_circuits__pb2.RunCircuitsResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'hwman.Circuits', rpc_method_handlers)
@@ -98,3 +133,57 @@ class Circuits(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def RunCircuitStream(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/hwman.Circuits/RunCircuitStream',
+            hwman_dot_grpc_dot_protobufs_dot_circuits__pb2.RunCircuitRequest.SerializeToString,
+            hwman_dot_grpc_dot_protobufs_dot_circuits__pb2.RunCircuitResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def RunCircuits(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/hwman.Circuits/RunCircuits',
+            hwman_dot_grpc_dot_protobufs_dot_circuits__pb2.RunCircuitsRequest.SerializeToString,
+            hwman_dot_grpc_dot_protobufs_dot_circuits__pb2.RunCircuitsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
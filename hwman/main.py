@@ -1,4 +1,5 @@
 import logging
+import os
 from concurrent import futures
 
 import grpc
@@ -13,6 +14,13 @@ from hwman.services.circuits import CircuitService
 
 logger = logging.getLogger(__name__)
 
+# Accept the clients' 30 s keepalive pings, including during long-running calls
+# that send no data, instead of answering them with GOAWAY (too_many_pings).
+SERVER_OPTIONS = [
+    ("grpc.http2.min_ping_interval_without_data_ms", 20000),
+    ("grpc.http2.max_ping_strikes", 0),
+]
+
 
 class Server:
     def __init__(self, config: HwmanSettings) -> None:
@@ -50,7 +58,10 @@ class Server:
         logger.info("Initializing certificates...")
 
         # Initialize certificate manager
-        cert_manager = CertificateManager(self.cert_dir)
+        cert_manager = CertificateManager(
+            self.cert_dir,
+            ca_key_password=self.config.ca_key_password.get_secret_value().encode() or None,
+        )
 
         # Set up CA and server certificates (creates them if they don't exist)
         ca_cert_file, server_cert_file, server_key_file = (
@@ -58,24 +69,16 @@ class Server:
         )
 
         # Load the certificates for gRPC
-        try:
-            with open(server_cert_file, "rb") as f:
-                self.server_cert = f.read()
-        except FileNotFoundError as e:
-            logger.error(f"Server certificate file not found: {server_cert_file}")
-            raise e
-        try:
-            with open(server_key_file, "rb") as f:
-                self.server_key = f.read()
-        except FileNotFoundError as e:
-            logger.error(f"Server key file not found: {server_key_file}")
-            raise e
-        try:
-            with open(ca_cert_file, "rb") as f:
-                self.ca_cert = f.read()
-        except FileNotFoundError as e:
-            logger.error(f"CA certificate file not found: {ca_cert_file}")
-            raise e
+        for attr, label, path in (
+            ("server_cert", "Server certificate", server_cert_file),
+            ("server_key", "Server key", server_key_file),
+            ("ca_cert", "CA certificate", ca_cert_file),
+        ):
+            try:
+                setattr(self, attr, path.read_bytes())
+            except FileNotFoundError:
+                logger.error(f"{label} file not found: {path}")
+                raise
 
         logger.info("Certificates initialized successfully.")
 
@@ -134,9 +137,17 @@ class Server:
                 require_client_auth=True,
             )
 
-            self.server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+            workers = self.config.grpc_workers or min(32, (os.cpu_count() or 1) + 4)
+            self.server = grpc.server(
+                futures.ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="hwman-grpc"
+                ),
+                options=SERVER_OPTIONS,
+            )
 
-            logger.info("Server instantiated, adding mtls channel.")
+            logger.info(
+                f"Server instantiated with {workers} workers, adding mtls channel."
+            )
 
             self.server.add_secure_port(f"[::]:{self.port}", server_credentials)
 
@@ -4,10 +4,12 @@ Service for executing quantum circuits on the QPU hardware.
 
 import logging
 from collections import Counter
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List
 from pathlib import Path
 
 import grpc
+import numpy as np
 
 from labcore.measurement.storage import run_and_save_sweep
 from labcore.data.datadict_storage import datadict_from_hdf5
@@ -16,17 +18,38 @@ from hwman.grpc.protobufs_compiled.circuits_pb2_grpc import CircuitsServicer  #
 from hwman.grpc.protobufs_compiled.circuits_pb2 import (  # type: ignore
     RunCircuitRequest,
     RunCircuitResponse,
-    DistributionEntry,
+    RunCircuitsRequest,
+    RunCircuitsResponse,
     Gate as ProtoGate,
 )
 from hwman.services import Service
 from hwman.services.readout_calibrator import ReadoutCalibrator
 from hwman.utils.hw_tests import generate_id
 from hwman.compiler.circuit import Circuit
-from hwman.compiler.qick_codegen import QICKProgramGenerator, compile_circuit_to_qick
+from hwman.compiler.qick_codegen import QICKProgramGenerator
 
 logger = logging.getLogger(__name__)
 
+# Responses carry one raw bitstring per shot; past this many shots the repeated
+# '0'/'1' strings compress well enough that gzip is worth its CPU cost.
+GZIP_MIN_SHOTS = 1024
+
+# Shots per follow-up message in RunCircuitStream.
+STREAM_CHUNK_SHOTS = 4096
+
+
+@lru_cache(maxsize=64)
+def _program_class(program_body: str) -> Any:
+    """exec generated QICK program code once per distinct program and return its class.
+
+    Keyed on `QICKProgramGenerator.generate_program_body()`, which leaves out
+    the per-run header (PID). Call ``_program_class.cache_clear()`` to force
+    recompilation.
+    """
+    ns: Dict[str, Any] = {}
+    exec(program_body, ns)
+    return ns["CompiledProgram"]
+
 
 class CircuitService(Service, CircuitsServicer):
     """Service for executing quantum circuits on QPU hardware."""
@@ -80,6 +103,50 @@ class CircuitService(Service, CircuitsServicer):
         Returns:
             RunCircuitResponse with measurement distribution
         """
+        response, raw_bitstream = self._run_circuit(request, context)
+        if request.packed_bitstream:
+            response.packed_bitstream = self._pack_bitstream(raw_bitstream)
+        else:
+            response.raw_bitstream.extend(raw_bitstream)
+        return response
+
+    def RunCircuits(
+        self, request: RunCircuitsRequest, context: grpc.ServicerContext
+    ) -> RunCircuitsResponse:
+        """
+        Execute several circuits in one call, in order.
+
+        Each circuit is handled exactly as by RunCircuit; a failing circuit gets
+        an unsuccessful entry and does not stop the others.
+        """
+        logger.info(f"RunCircuits called with {len(request.circuits)} circuits")
+        return RunCircuitsResponse(
+            results=[self.RunCircuit(circuit, context) for circuit in request.circuits]
+        )
+
+    def RunCircuitStream(
+        self, request: RunCircuitRequest, context: grpc.ServicerContext
+    ) -> Iterator[RunCircuitResponse]:
+        """
+        Execute a quantum circuit, streaming the per-shot results.
+
+        The first message is the RunCircuit response without per-shot data; each
+        following one carries the next STREAM_CHUNK_SHOTS shots, so the client
+        can receive and decode while later chunks are still being serialized.
+        """
+        response, raw_bitstream = self._run_circuit(request, context)
+        yield response
+        for start in range(0, len(raw_bitstream), STREAM_CHUNK_SHOTS):
+            chunk = raw_bitstream[start : start + STREAM_CHUNK_SHOTS]
+            if request.packed_bitstream:
+                yield RunCircuitResponse(packed_bitstream=self._pack_bitstream(chunk))
+            else:
+                yield RunCircuitResponse(raw_bitstream=chunk)
+
+    def _run_circuit(
+        self, request: RunCircuitRequest, context: grpc.ServicerContext
+    ) -> tuple[RunCircuitResponse, List[str]]:
+        """Run the circuit; returns the response without per-shot data, and the shots."""
         pid = request.pid
         if not pid:
             pid = generate_id()
@@ -88,14 +155,18 @@ class CircuitService(Service, CircuitsServicer):
             f"RunCircuit called: pid={pid}, gates={len(request.gates)}, shots={request.shots}"
         )
 
-        # Log the gates for debugging
-        for i, gate in enumerate(request.gates):
-            logger.debug(
-                f"  Gate {i}: {gate.symbol} "
-                f"targets={list(gate.target_qubits)} "
-                f"controls={list(gate.control_qubits)} "
-                f"params={list(gate.params)}"
-            )
+        # Log the gates for debugging (the f-strings below copy every repeated
+        # field, so skip the loop entirely unless debug logging is on)
+        if logger.isEnabledFor(logging.DEBUG):
+            for i, gate in enumerate(request.gates):
+                logger.debug(
+                    "  Gate %d: %s targets=%s controls=%s params=%s",
+                    i,
+                    gate.symbol,
+                    list(gate.target_qubits),
+                    list(gate.control_qubits),
+                    list(gate.params),
+                )
 
         # Validate inputs
         if request.shots <= 0:
@@ -105,7 +176,7 @@ class CircuitService(Service, CircuitsServicer):
                 success=False,
                 message=f"Invalid shots value: {request.shots}. Must be positive.",
                 distribution=[],
-            )
+            ), []
 
         if len(request.gates) == 0:
             logger.warning(f"Empty circuit received for pid={pid}")
@@ -114,7 +185,7 @@ class CircuitService(Service, CircuitsServicer):
                 success=False,
                 message="Circuit must contain at least one gate.",
                 distribution=[],
-            )
+            ), []
 
         try:
             # Convert proto request to internal Circuit representation
@@ -128,21 +199,22 @@ class CircuitService(Service, CircuitsServicer):
                 # Execute on real hardware
                 distribution, raw_bitstream = self._execute_circuit(circuit)
 
-            # Convert distribution dict to proto format
-            distribution_entries = [
-                DistributionEntry(bitstring=bitstring, count=count)
-                for bitstring, count in distribution.items()
-            ]
+            if len(raw_bitstream) >= GZIP_MIN_SHOTS:
+                context.set_compression(grpc.Compression.Gzip)
 
             logger.info(f"Circuit execution completed: pid={pid}")
-            return RunCircuitResponse(
+            response = RunCircuitResponse(
                 pid=pid,
                 success=True,
                 message="Circuit executed successfully",
-                distribution=distribution_entries,
-                raw_bitstream=raw_bitstream,
                 data_path=str(self.data_dir / pid),
             )
+            # Build the distribution entries in place rather than constructing
+            # standalone messages that the constructor would then copy in.
+            add_entry = response.distribution.add
+            for bitstring, count in distribution.items():
+                add_entry(bitstring=bitstring, count=count)
+            return response, raw_bitstream
 
         except Exception as e:
             logger.error(f"Circuit execution failed for pid={pid}: {e}", exc_info=True)
@@ -151,7 +223,7 @@ class CircuitService(Service, CircuitsServicer):
                 success=False,
                 message=f"Circuit execution failed: {str(e)}",
                 distribution=[],
-            )
+            ), []
 
     def _execute_circuit(self, circuit: Circuit) -> tuple[Dict[str, int], List[str]]:
         """
@@ -174,14 +246,16 @@ class CircuitService(Service, CircuitsServicer):
         generator = QICKProgramGenerator(circuit)
         measured_qubits = generator._get_measured_qubits_in_order()
 
-        source = compile_circuit_to_qick(circuit)
-
-        ns: Dict[str, Any] = {}
-        exec(source, ns)
+        # The PID only appears in the program header, so the body is identical
+        # for repeated runs of the same circuit. The saved source is the header
+        # plus that same body, so what runs always matches what is stored.
+        body = generator.generate_program_body()
+        source = f"{generator.generate_header()}\n\n{body}"
+        program_class = _program_class(body)
         prev_reps = self.conf.params.qick.default_reps()
         self.conf.params.qick.default_reps(1)
         try:
-            sweep = ns["CompiledProgram"]()
+            sweep = program_class()
             data_loc, _ = run_and_save_sweep(sweep, str(self.data_dir), circuit.pid, source_code=str({source}))
         finally:
             self.conf.params.qick.default_reps(prev_reps)
@@ -204,19 +278,28 @@ class CircuitService(Service, CircuitsServicer):
         Raises:
             RuntimeError: If the calibrator has not been fitted via ROCal.
         """
-        labels_per_qubit = []
-        for q in measured_qubits:
-            raw = data[f"qubit_{q}"]["values"]  # complex array, shape (shots,)
-            labels_per_qubit.append(self.calibrator.label(raw.real.flatten(), raw.imag.flatten()))
+        # Stack every qubit's shots (complex arrays of shape (shots,)) and label
+        # them in a single calibrator call rather than one call per qubit.
+        raw = np.stack([data[f"qubit_{q}"]["values"] for q in measured_qubits])
+        labels = self.calibrator.label(raw.real, raw.imag).astype(np.uint8)
 
-        n_shots = len(labels_per_qubit[0])
-        bitstrings = [
-            "".join(str(labels_per_qubit[qi][s]) for qi in range(len(measured_qubits)))
-            for s in range(n_shots)
-        ]
+        # One ASCII '0'/'1' byte per qubit, laid out shot-major so that each row
+        # reinterpreted as a fixed-width byte string is that shot's bitstring.
+        chars = np.ascontiguousarray(labels.T) + ord("0")
+        bitstrings = chars.view(f"S{len(measured_qubits)}").ravel().astype(str).tolist()
 
         return dict(Counter(bitstrings)), bitstrings
 
+    @staticmethod
+    def _pack_bitstream(raw_bitstream: List[str]) -> bytes:
+        """Encode per-shot bitstrings as one 0/1 byte per qubit, shot-major.
+
+        This is far smaller on the wire than a repeated string field and decodes
+        with a single ``np.frombuffer(...).reshape(shots, n_qubits)``.
+        """
+        chars = np.frombuffer("".join(raw_bitstream).encode("ascii"), dtype=np.uint8)
+        return (chars - ord("0")).astype(np.uint8).tobytes()
+
     def _generate_fake_distribution(self, shots: int) -> tuple[Dict[str, int], List[str]]:
         """
         Generate a fake measurement distribution for testing.
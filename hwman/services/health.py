@@ -421,6 +421,10 @@ class HealthService(Service, HealthServicer):
                 remote_cmd,
             ]
 
+            # A board killed by a previous stop leaves its entry behind in the
+            # nameserver, so remember it and wait for a new registration.
+            stale_uri = self._lookup_qick_uri()
+
             self.qick_server_process = subprocess.Popen(
                 cmd,
                 stdin=subprocess.PIPE,
@@ -435,14 +439,51 @@ class HealthService(Service, HealthServicer):
                 self.qick_server_process.stdin.write(f"{self.qick_ssh_password}\n")
                 self.qick_server_process.stdin.flush()
 
-            time.sleep(20)
-            qick_server_logger.info("Qick server started successfully")
+            if self._wait_for_qick_registration(stale_uri):
+                qick_server_logger.info("Qick server started successfully")
+            elif self.qick_server_process.poll() is not None:
+                return False, f"Qick server exited with code {self.qick_server_process.returncode}"
+            else:
+                qick_server_logger.warning(
+                    f"'{self.proxy_ns_name}' is not registered with the nameserver yet; continuing"
+                )
             return True, f"Qick server started with PID: {self.qick_server_process.pid}"
 
         except Exception as e:
             qick_server_logger.error(f"Failed to start qick server: {e}")
             return False, f"Failed to start qick server: {e}"
 
+    def _lookup_qick_uri(self) -> str | None:
+        """Return the URI registered for `proxy_ns_name`, or None if it cannot be looked up."""
+        import Pyro4
+        import Pyro4.errors
+
+        try:
+            with Pyro4.locateNS(host=self.ns_host, port=self.ns_port) as ns:
+                return str(ns.lookup(self.proxy_ns_name))
+        except Pyro4.errors.PyroError:
+            return None
+
+    def _wait_for_qick_registration(self, stale_uri: str | None = None, timeout: float = 20.0) -> bool:
+        """
+        Wait until the QICK board has registered `proxy_ns_name` with the Pyro
+        nameserver, instead of always sleeping for the worst-case startup time.
+
+        A registration equal to `stale_uri` (left over from a board that was
+        stopped without unregistering) does not count.
+
+        Returns False if `timeout` seconds pass or the SSH process exits first.
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.qick_server_process is None or self.qick_server_process.poll() is not None:
+                return False
+            uri = self._lookup_qick_uri()
+            if uri is not None and uri != stale_uri:
+                return True
+            time.sleep(0.5)
+        return False
+
     def _stop_qick_server(self) -> tuple[bool, str]:
         """Stop the qick server subprocess."""
         qick_server_logger.info("Stopping qick server...")
@@ -46,8 +46,8 @@ class ReadoutCalibrator:
             I_ground, Q_ground: numpy arrays of I/Q values for the ground state.
             I_excited, Q_excited: numpy arrays of I/Q values for the excited state.
         """
-        all_I = np.concatenate([I_ground.flatten(), I_excited.flatten()])
-        all_Q = np.concatenate([Q_ground.flatten(), Q_excited.flatten()])
+        all_I = np.concatenate([I_ground.ravel(), I_excited.ravel()])
+        all_Q = np.concatenate([Q_ground.ravel(), Q_excited.ravel()])
         cal_dset = xr.Dataset({
             f"{self._VAR}_Re": (["repetition"], all_I),
             f"{self._VAR}_Im": (["repetition"], all_Q),
@@ -74,9 +74,10 @@ class ReadoutCalibrator:
             )
         I_arr = np.asarray(I)
         shp = I_arr.shape
+        # ravel, not flatten: no copy when the input is already contiguous.
         data = xr.Dataset({
-            f"{self._VAR}_Re": (["repetition"], I_arr.flatten()),
-            f"{self._VAR}_Im": (["repetition"], np.asarray(Q).flatten()),
+            f"{self._VAR}_Re": (["repetition"], I_arr.ravel()),
+            f"{self._VAR}_Im": (["repetition"], np.ravel(Q)),
         })
         labeled = apply_kmeans_calibration(data, self._VAR, self.km)
         return labeled["label"].values.reshape(shp)
@@ -92,8 +93,8 @@ class ReadoutCalibrator:
                 "ReadoutCalibrator has not been fitted — run ROCal before calling probabilities()."
             )
         data = xr.Dataset({
-            f"{self._VAR}_Re": (["repetition"], np.asarray(I).flatten()),
-            f"{self._VAR}_Im": (["repetition"], np.asarray(Q).flatten()),
+            f"{self._VAR}_Re": (["repetition"], np.ravel(I)),
+            f"{self._VAR}_Im": (["repetition"], np.ravel(Q)),
         })
         labeled = apply_kmeans_calibration(data, self._VAR, self.km)
         result = lbl2prob(labeled)
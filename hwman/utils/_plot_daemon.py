@@ -0,0 +1,59 @@
+"""
+Long-lived plotting process used by `hwman.utils.plotting.create_plot_in_subprocess`.
+
+Reads PlotSpec objects from stdin, one after another, renders each one
+and answers with a single line on stdout: "OK" or "ERROR <message>". Keeping
+this process alive means the interpreter and matplotlib are started once, not
+once per plot.
+
+Each request is a pickled (payload_size, buffer_sizes) header, followed by the
+protocol 5 pickle of the spec and then its out-of-band buffers (array data).
+"""
+
+import os
+import pickle
+import sys
+from typing import BinaryIO
+
+from hwman.utils.plotting import _plot_init, _plot_worker
+
+
+def _read_exact(stream: BinaryIO, size: int) -> bytearray:
+    buf = bytearray(size)
+    view = memoryview(buf)
+    while view:
+        n = stream.readinto(view)  # type: ignore[attr-defined]
+        if not n:
+            raise EOFError("plot request truncated")
+        view = view[n:]
+    return buf
+
+
+def main() -> None:
+    # Anything printed while plotting must not end up in the reply channel.
+    replies = os.fdopen(os.dup(sys.stdout.fileno()), "w", buffering=1)
+    sys.stdout = sys.stderr
+
+    _plot_init()
+    requests = sys.stdin.buffer
+    while True:
+        try:
+            payload_size, buffer_sizes = pickle.load(requests)
+            payload = _read_exact(requests, payload_size)
+            buffers = [_read_exact(requests, size) for size in buffer_sizes]
+            spec = pickle.loads(payload, buffers=buffers)
+        except EOFError:
+            return
+        except Exception as e:
+            replies.write(f"ERROR could not read plot spec: {e}\n")
+            return
+
+        try:
+            ok = _plot_worker(spec)
+            replies.write("OK\n" if ok else "ERROR plotting failed\n")
+        except Exception as e:
+            replies.write(f"ERROR {e}\n")
+
+
+if __name__ == "__main__":
+    main()
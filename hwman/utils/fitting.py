@@ -1,11 +1,9 @@
 import logging
-import os
-import pickle
-import subprocess
-import sys
-import tempfile
+import threading
 from dataclasses import dataclass
-from typing import Any, Dict, Tuple
+from multiprocessing import cpu_count, get_context
+from multiprocessing.connection import Connection
+from typing import Any, Dict, List, Tuple
 
 import numpy as np
 
@@ -20,46 +18,90 @@ class FitSpec:
     fit_kwargs: Dict[str, Any] = None
 
 
-def fit_in_subprocess(fit_spec: FitSpec) -> Tuple[Any, np.ndarray, float] | None:
-    """
-    Run fitting in a subprocess to avoid lmfit hanging issues.
-    Returns the same objects as _fit_and_snr: (fit_result, residuals, snr)
+# Fits run in separate worker processes, started on first use and kept warm, so
+# a hanging lmfit call (or the GIL-heavy fit itself) cannot stall the gRPC
+# worker threads. Each fit has a worker to itself: when one times out, only
+# that process is killed, and fits running in the other workers carry on.
+FIT_TIMEOUT = 60  # seconds
 
-    Args:
-        fit_spec: FitSpec containing the coordinates, data and fit class to use
+MAX_FIT_WORKERS = max(2, cpu_count() - 1)
 
-    Returns:
-        Tuple of (fit_result, residuals, snr) or None if fitting fails
-    """
-    with tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix='.pkl') as tmp_input:
-        pickle.dump(fit_spec, tmp_input)
-        input_path = tmp_input.name
+_idle_workers: List["_FitWorker"] = []
+_workers_lock = threading.Lock()
+_worker_slots = threading.BoundedSemaphore(MAX_FIT_WORKERS)
 
-    with tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix='.pkl') as tmp_output:
-        output_path = tmp_output.name
 
-    fit_script = f'''
-import pickle
-import numpy as np
-from dataclasses import dataclass
-from typing import Any, Dict
+def _fit_init() -> None:
+    """Worker start-up: pay the lmfit import once per worker instead of per fit."""
+    try:
+        import lmfit  # noqa: F401
+    except ImportError:
+        pass
 
-@dataclass
-class FitSpec:
-    coordinates: Any
-    data: Any
-    fit_class: Any
-    fit_kwargs: Dict[str, Any] = None
 
-try:
-    # Load input data
-    with open('{input_path}', 'rb') as f:
-        spec = pickle.load(f)
+def _fit_worker_loop(conn: Connection) -> None:
+    """Worker process main loop: answer each FitSpec with (ok, result or error)."""
+    _fit_init()
+    while True:
+        try:
+            spec = conn.recv()
+        except EOFError:
+            return
+        if spec is None:
+            return
+        try:
+            conn.send((True, _fit_worker(spec)))
+        except Exception as e:
+            conn.send((False, f"{e}, {type(e)}"))
+
+
+class _FitWorker:
+    """One warm fitting process, driven over a pipe."""
+
+    def __init__(self) -> None:
+        # spawn, not fork: the parent is a multi-threaded gRPC server
+        ctx = get_context("spawn")
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_fit_worker_loop, args=(child_conn,), name="hwman-fit", daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+
+    def stop(self) -> None:
+        """Ask the worker to exit, killing it if it does not."""
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(1)
+        if self.process.is_alive():
+            self.kill()
+        else:
+            self.conn.close()
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+def _acquire_worker() -> _FitWorker:
+    with _workers_lock:
+        if _idle_workers:
+            return _idle_workers.pop()
+    return _FitWorker()
+
 
-    # Initialize fit kwargs if not provided
-    fit_kwargs = spec.fit_kwargs or {{}}
+def _release_worker(worker: _FitWorker) -> None:
+    with _workers_lock:
+        _idle_workers.append(worker)
+
+
+def _fit_worker(spec: FitSpec) -> Tuple[Any, np.ndarray, float]:
+    """Run one fit; executes in a fitting worker process."""
+    fit_kwargs = spec.fit_kwargs or {}
 
-    # Perform the fit
     fit = spec.fit_class(spec.coordinates, spec.data, **fit_kwargs)
     fit_result = fit.run(fit)
     fit_curve = fit_result.eval()
@@ -67,72 +109,65 @@ try:
 
     # Calculate SNR
     amp = fit_result.params["A"].value
-    noise = np.std(residuals)
+    # Same as np.std(residuals), real or complex, as one BLAS dot product
+    # instead of separate abs/square/mean passes.
+    centered = residuals - residuals.mean()
+    noise = np.sqrt(np.vdot(centered, centered).real / centered.size)
     snr = np.abs(amp/(4*noise))
+    return fit_result, residuals, snr
 
-    # Save results
-    result = {{
-        'fit_result': fit_result,
-        'residuals': residuals,
-        'snr': snr,
-        'success': True
-    }}
-
-    with open('{output_path}', 'wb') as f:
-        pickle.dump(result, f)
-
-    print("FIT_SUCCESS")
 
-except Exception as e:
-    # Save error information
-    error_result = {{
-        'error': str(e),
-        'success': False
-    }}
-
-    with open('{output_path}', 'wb') as f:
-        pickle.dump(error_result, f)
-
-    print(f"FIT_ERROR: {{e}}, {{type(e)}}")
-'''
-
-    try:
-        result = subprocess.run(
-            [sys.executable, '-c', fit_script],
-            capture_output=True, text=True, timeout=60
-        )
+def fit_in_subprocess(fit_spec: FitSpec) -> Tuple[Any, np.ndarray, float] | None:
+    """
+    Run fitting in a subprocess to avoid lmfit hanging issues.
+    Returns the same objects as _fit_and_snr: (fit_result, residuals, snr)
 
-        if result.returncode == 0 and "FIT_SUCCESS" in result.stdout:
-            # Load successful results
-            with open(output_path, 'rb') as f:
-                fit_data = pickle.load(f)
+    Args:
+        fit_spec: FitSpec containing the coordinates, data and fit class to use
 
-            if fit_data['success']:
-                return fit_data['fit_result'], fit_data['residuals'], fit_data['snr']
-            else:
-                logger.error(f"Fitting failed: {fit_data.get('error', 'Unknown error')}")
+    Returns:
+        Tuple of (fit_result, residuals, snr) or None if fitting fails.
+        The evaluated fit curve is ``fit_spec.data - residuals``; use that
+        instead of calling ``fit_result.eval()`` again for plotting.
+    """
+    with _worker_slots:
+        worker: _FitWorker | None = None
+        try:
+            worker = _acquire_worker()
+            worker.conn.send(fit_spec)
+            if not worker.conn.poll(FIT_TIMEOUT):
+                logger.error("Fitting subprocess timed out")
+                # Only this fit's worker is stuck; replace it, leave the rest alone.
+                worker.kill()
+                worker = None
                 return None
-        else:
-            logger.error(f"Fitting subprocess failed: {result.stderr}")
-            logger.error(f"Stdout: {result.stdout}")
+            ok, result = worker.conn.recv()
+        except (EOFError, OSError) as e:
+            logger.error(f"Fitting subprocess failed: {e}")
+            if worker is not None:
+                worker.kill()
+                worker = None
             return None
+        except Exception as e:
+            logger.error(f"Error running fitting subprocess: {e}")
+            return None
+        finally:
+            if worker is not None:
+                _release_worker(worker)
 
-    except subprocess.TimeoutExpired:
-        logger.error("Fitting subprocess timed out")
-        return None
-    except Exception as e:
-        logger.error(f"Error running fitting subprocess: {e}")
+    if not ok:
+        logger.error(f"Fitting failed: {result}")
         return None
-    finally:
-        # Clean up temporary files
-        try:
-            os.unlink(input_path)
-        except OSError:
-            pass
-        try:
-            os.unlink(output_path)
-        except OSError:
-            pass
+    return result
+
+
+def cleanup_fitting_pool() -> None:
+    """Stop the idle fitting worker processes."""
+    with _workers_lock:
+        workers = _idle_workers[:]
+        _idle_workers.clear()
+    for worker in workers:
+        worker.stop()
 
 
 def serialize_params(params):
@@ -1,4 +1,4 @@
-import uuid
+import secrets
 import logging
 from pathlib import Path
 from enum import Enum, auto
@@ -33,26 +33,29 @@ class TestReturn:
 
 
 def generate_id():
-    return str(uuid.uuid4())[:8]
+    return secrets.token_hex(4)
 
 
 def set_bandpass_filters(conf_: QBoardConfig):
+    # config() rebuilds the whole config from parameter reads; take one snapshot.
+    cfg = conf_.config()[1]
+
     # Setting badnpass filters for DAC
-    conf_.soc.rfb_set_gen_filter(conf_.config()[1]['q_dac_ch'], fc=conf_.config()[1]["q_freq"] / 1000,
+    conf_.soc.rfb_set_gen_filter(cfg['q_dac_ch'], fc=cfg["q_freq"] / 1000,
                                 ftype='bandpass',
                                 bw=1.0)  # Frequency unitsh ere are in GHz
-    conf_.soc.rfb_set_gen_filter(conf_.config()[1]['ro_dac_ch'], fc=conf_.config()[1]["ro_freq"] / 1000,
+    conf_.soc.rfb_set_gen_filter(cfg['ro_dac_ch'], fc=cfg["ro_freq"] / 1000,
                                 ftype='bandpass',
                                 bw=1.0)  # Frequency unitsh ere are in GHz
-    conf_.soc.rfb_set_ro_filter(conf_.config()[1]['ro_adc_ch'], fc=conf_.config()[1]["ro_freq"] / 1000,
+    conf_.soc.rfb_set_ro_filter(cfg['ro_adc_ch'], fc=cfg["ro_freq"] / 1000,
                                ftype='bandpass',
                                bw=1.0)  # Frequency unitsh ere are in GHz
 
     # Set attenuator on DAC.
-    conf_.soc.rfb_set_gen_rf(conf_.config()[1]['q_dac_ch'], 5, 5)  # Frequency unitsh ere are in GHz
-    conf_.soc.rfb_set_gen_rf(conf_.config()[1]['ro_dac_ch'], 5, 15)  # Frequency unitsh ere are in GHz
+    conf_.soc.rfb_set_gen_rf(cfg['q_dac_ch'], 5, 5)  # Frequency unitsh ere are in GHz
+    conf_.soc.rfb_set_gen_rf(cfg['ro_dac_ch'], 5, 15)  # Frequency unitsh ere are in GHz
     # Set attenuator on ADC.
-    conf_.soc.rfb_set_ro_rf(conf_.config()[1]['ro_adc_ch'], 0)  # Frequency unitsh ere are in GHz
+    conf_.soc.rfb_set_ro_rf(cfg['ro_adc_ch'], 0)  # Frequency unitsh ere are in GHz
 
 
 def setup_measurement_env() -> QickConfig:
@@ -1,18 +1,14 @@
+import atexit
 import logging
-import os
 import pickle
+import select
 import subprocess
 import sys
-import tempfile
+import threading
 from dataclasses import dataclass, field
 from multiprocessing import Pool, cpu_count
 from typing import Any, Dict, List, Tuple, Union
 
-import matplotlib
-
-matplotlib.use('Agg')  # Use non-interactive backend
-import matplotlib.pyplot as plt
-
 logger = logging.getLogger(__name__)
 
 
@@ -39,13 +35,36 @@ class PlotSpec:
 # Global process pool for plotting
 _plotting_pool: Union[Pool, None] = None
 
+# matplotlib.pyplot, imported by _plot_init in the process that draws the plots.
+# The parent never imports matplotlib, and each pool worker pays the (slow)
+# import once rather than per plot.
+plt: Any = None
+
+
+def _plot_init() -> None:
+    """Import matplotlib with the non-interactive backend (pool initializer)."""
+    global plt
+    if plt is None:
+        import matplotlib
+
+        matplotlib.use('Agg')  # Use non-interactive backend
+        import matplotlib.pyplot
+
+        plt = matplotlib.pyplot
+
 
 def _get_plotting_pool():
     """Get or create a process pool for plotting."""
     global _plotting_pool
     if _plotting_pool is None:
-        # Use 2 processes for plotting to avoid overwhelming the system
-        _plotting_pool = Pool(processes=min(2, cpu_count()), maxtasksperchild=10)
+        # Use 2 processes for plotting to avoid overwhelming the system.
+        # Workers are recycled only occasionally (to bound matplotlib leaks),
+        # so the matplotlib import done by _plot_init is reused across plots.
+        _plotting_pool = Pool(
+            processes=min(2, cpu_count()),
+            initializer=_plot_init,
+            maxtasksperchild=100,
+        )
     return _plotting_pool
 
 def _plot_worker(plot_spec: PlotSpec):
@@ -53,6 +72,7 @@ def _plot_worker(plot_spec: PlotSpec):
     Generic worker function that runs in a separate process to create plots.
     This avoids matplotlib threading issues.
     """
+    _plot_init()
     try:
         fig, ax = plt.subplots(figsize=plot_spec.figsize)
 
@@ -65,7 +85,9 @@ def _plot_worker(plot_spec: PlotSpec):
 
         for plot_item in plot_spec.plots:
             if plot_item.plot_type == "colorbar":
-                # For colorbar plots, x and y are coordinates, z is the values
+                # For colorbar plots, x and y are coordinates, z is the values.
+                # Pass 1-D x (len N) and y (len M) with z of shape (M, N); there
+                # is no need to meshgrid the coordinates first.
                 # Extract colorbar-specific kwargs
                 colorbar_kwargs = {}
                 plot_kwargs = plot_item.kwargs.copy()
@@ -96,107 +118,90 @@ def _plot_worker(plot_spec: PlotSpec):
         return False
 
 
-def create_plot_in_subprocess(plot_spec: PlotSpec):
-    """
-    Fallback thread-safe plotting using a subprocess to isolate matplotlib.
-    """
-    with tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix='.pkl') as tmp_file:
-        pickle.dump(plot_spec, tmp_file)
-        tmp_path = tmp_file.name
-
-    plot_script = f'''
-import pickle
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Tuple
-import matplotlib
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
+# Persistent plotting subprocess (see hwman/utils/_plot_daemon.py); one plot at a time.
+_plot_proc: Union[subprocess.Popen, None] = None
+_plot_proc_lock = threading.Lock()
 
-@dataclass
-class PlotItem:
-    x: Any
-    y: Any
-    z: Any = None  # For 2D colorbar plots
-    plot_type: str = "line"  # "line", "scatter", or "colorbar"
-    kwargs: Dict[str, Any] = field(default_factory=dict)
+PLOT_TIMEOUT = 30  # seconds
 
-@dataclass
-class PlotSpec:
-    plot_path: str
-    title: str = ""
-    xlabel: str = ""
-    ylabel: str = ""
-    legend: bool = False
-    figsize: Tuple[float, float] = (10, 6)
-    plots: List[PlotItem] = field(default_factory=list)
 
-try:
-    with open(\'{tmp_path}\', \'rb\') as f:
-        spec = pickle.load(f)
-
-    fig, ax = plt.subplots(figsize=spec.figsize)
-    if spec.title:
-        ax.set_title(spec.title)
-    if spec.xlabel:
-        ax.set_xlabel(spec.xlabel)
-    if spec.ylabel:
-        ax.set_ylabel(spec.ylabel)
-    for item in spec.plots:
-        if item.plot_type == "colorbar":
-            # For colorbar plots, x and y are coordinates, z is the values
-            # Extract colorbar-specific kwargs
-            colorbar_kwargs = {{}}
-            plot_kwargs = item.kwargs.copy()
-            if 'colorbar_label' in plot_kwargs:
-                colorbar_kwargs['label'] = plot_kwargs.pop('colorbar_label')
-
-            im = ax.pcolormesh(item.x, item.y, item.z, **plot_kwargs)
-            cbar = fig.colorbar(im, ax=ax)
-
-            # Apply colorbar label if provided
-            if 'label' in colorbar_kwargs:
-                cbar.set_label(colorbar_kwargs['label'])
-        elif item.plot_type == "scatter":
-            # Scatter plot
-            ax.scatter(item.x, item.y, **item.kwargs)
-        else:
-            # Default line plot
-            ax.plot(item.x, item.y, **item.kwargs)
-    if spec.legend:
-        ax.legend()
-    fig.savefig(spec.plot_path, dpi=300, bbox_inches='tight')
-    plt.close(fig)
-    print("SUCCESS")
-except Exception as e:
-    print(f"ERROR: {{e}}")
-'''
-    try:
-        result = subprocess.run(
-            [sys.executable, '-c', plot_script],
-            capture_output=True, text=True, timeout=30
+def _get_plot_proc() -> subprocess.Popen:
+    """Return the plotting subprocess, (re)starting it if needed. Hold _plot_proc_lock."""
+    global _plot_proc
+    if _plot_proc is None or _plot_proc.poll() is not None:
+        _plot_proc = subprocess.Popen(
+            [sys.executable, '-m', 'hwman.utils._plot_daemon'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
         )
-        if result.returncode == 0 and "SUCCESS" in result.stdout:
-            return True
-        else:
-            logger.error(f"Plotting subprocess failed: {result.stderr} \n result.stdout: {result.stdout}")
-            return False
-    except subprocess.TimeoutExpired:
-        logger.error("Plotting subprocess timed out")
-        return False
-    except Exception as e:
-        logger.error(f"Error running plotting subprocess: {e}")
-        return False
-    finally:
+    return _plot_proc
+
+
+@atexit.register
+def _stop_plot_proc() -> None:
+    """Terminate the plotting subprocess, if any. Hold _plot_proc_lock."""
+    global _plot_proc
+    if _plot_proc is not None:
+        if _plot_proc.stdin is not None:
+            _plot_proc.stdin.close()
+        try:
+            _plot_proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            _plot_proc.kill()
+            _plot_proc.wait()
+        _plot_proc = None
+
+
+def create_plot_in_subprocess(plot_spec: PlotSpec):
+    """
+    Fallback thread-safe plotting using a subprocess to isolate matplotlib.
+
+    The subprocess is started on first use and then kept alive, so only the
+    first plot pays for interpreter and matplotlib startup.
+    """
+    with _plot_proc_lock:
         try:
-            os.unlink(tmp_path)
-        except OSError:
-            pass
+            proc = _get_plot_proc()
+            assert proc.stdin is not None and proc.stdout is not None
+            # Protocol 5 hands contiguous NumPy arrays to buffer_callback instead
+            # of copying them into the pickle; they are written to the pipe as-is
+            # after a small header giving the payload and buffer sizes.
+            buffers: List[pickle.PickleBuffer] = []
+            payload = pickle.dumps(plot_spec, protocol=5, buffer_callback=buffers.append)
+            raw_buffers = [b.raw() for b in buffers]
+            pickle.dump((len(payload), [m.nbytes for m in raw_buffers]), proc.stdin)
+            proc.stdin.write(payload)
+            for m in raw_buffers:
+                proc.stdin.write(m)
+            proc.stdin.flush()
+
+            ready, _, _ = select.select([proc.stdout], [], [], PLOT_TIMEOUT)
+            if not ready:
+                logger.error("Plotting subprocess timed out")
+                proc.kill()
+                _stop_plot_proc()
+                return False
+
+            reply = proc.stdout.readline().decode().strip()
+            if reply == "OK":
+                return True
+            if not reply:
+                reply = f"exited with code {proc.wait()}"
+                _stop_plot_proc()
+            logger.error(f"Plotting subprocess failed: {reply}")
+            return False
+        except Exception as e:
+            logger.error(f"Error running plotting subprocess: {e}")
+            _stop_plot_proc()
+            return False
 
 
 def cleanup_plotting_pool():
-    """Clean up the plotting process pool."""
+    """Clean up the plotting process pool and the plotting subprocess."""
     global _plotting_pool
     if _plotting_pool is not None:
         _plotting_pool.close()
         _plotting_pool.join()
         _plotting_pool = None
+    with _plot_proc_lock:
+        _stop_plot_proc()
@@ -2,11 +2,13 @@
 Tests for QICK code generation from Circuit objects.
 """
 
+import re
+
 import numpy as np
 
 from lccfq_backend.model.tasks import Gate
 from hwman.services.circuits import Circuit
-from hwman.compiler.qick_codegen import compile_circuit_to_qick
+from hwman.compiler.qick_codegen import QICKProgramGenerator, compile_circuit_to_qick
 
 
 def test_rx_measure_circuit():
@@ -47,4 +49,37 @@ def test_multi_qubit_measurement_order():
     # Verify qubit_2 comes before qubit_0 in the decorator
     idx_qubit_2 = code.find("ComplexQICKData('qubit_2'")
     idx_qubit_0 = code.find("ComplexQICKData('qubit_0'")
-    assert idx_qubit_2 < idx_qubit_0, "qubit_2 should be measured before qubit_0"
\ No newline at end of file
+    assert idx_qubit_2 < idx_qubit_0, "qubit_2 should be measured before qubit_0"
+
+
+def test_program_body_is_pid_free():
+    """Test that the program body, used as the exec cache key, does not change with the PID."""
+    gates = [
+        Gate(symbol="x", target_qubits=[0], control_qubits=[], params=[]),
+        Gate(symbol="measure", target_qubits=[0], control_qubits=[], params=[]),
+    ]
+    first = QICKProgramGenerator(Circuit(gates=gates, shots=1000, pid="run-1"))
+    second = QICKProgramGenerator(Circuit(gates=gates, shots=1000, pid="run-2"))
+
+    assert first.generate_program_body() == second.generate_program_body()
+    assert first.generate_program() != second.generate_program()
+    assert first.generate_program().endswith(first.generate_program_body())
+
+
+def test_program_body_is_stable_across_generations():
+    """Test that the first and later generations agree and only play declared pulses."""
+    gates = [
+        Gate(symbol="x", target_qubits=[0], control_qubits=[], params=[]),
+        Gate(symbol="measure", target_qubits=[0], control_qubits=[], params=[]),
+    ]
+    generator = QICKProgramGenerator(Circuit(gates=gates, shots=1000, pid="run-1"))
+
+    first = generator.generate_program_body()
+    assert generator.generate_program() == f"{generator.generate_header()}\n\n{first}"
+    assert generator.generate_program_body() == first
+
+    initialize, body = first.split("    def _body(self, cfg):")
+    declared = set(re.findall(r"add_pulse\(ch=\w+, name='(\w+)'", initialize))
+    played = re.findall(r"self\.pulse\(ch=\w+, name='(\w+)'", body)
+    assert played
+    assert set(played) <= declared
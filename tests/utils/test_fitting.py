@@ -0,0 +1,80 @@
+"""
+Tests for running fits in worker processes.
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+from hwman.utils import fitting
+from hwman.utils.fitting import FitSpec, fit_in_subprocess
+
+
+class _Result:
+    """Minimal stand-in for an lmfit result: eval() and params["A"]."""
+
+    def __init__(self, curve: np.ndarray, amplitude: float):
+        self.curve = curve
+        self.params = {"A": SimpleNamespace(value=amplitude, stderr=0.0)}
+
+    def eval(self) -> np.ndarray:
+        return self.curve
+
+
+class ZeroFit:
+    """Fit that sleeps for `delay` seconds and returns a zero curve with A=2."""
+
+    def __init__(self, coordinates, data, delay: float = 0.0):
+        self.data = data
+        self.delay = delay
+
+    def run(self, _fit):
+        time.sleep(self.delay)
+        return _Result(np.zeros_like(self.data), amplitude=2.0)
+
+
+def test_fit_in_subprocess_returns_fit_and_snr():
+    x = np.linspace(0, 1, 101)
+    data = np.sin(2 * np.pi * x) + 0.1j * np.cos(2 * np.pi * x)
+
+    try:
+        result = fit_in_subprocess(FitSpec(x, data, ZeroFit))
+    finally:
+        fitting.cleanup_fitting_pool()
+
+    assert result is not None
+    _, residuals, snr = result
+    np.testing.assert_allclose(residuals, data)
+    np.testing.assert_allclose(snr, 2.0 / (4 * np.std(data)))
+
+
+def test_hung_fit_does_not_kill_other_fits(monkeypatch):
+    """A fit that times out is killed on its own; a fit running alongside still finishes."""
+    monkeypatch.setattr(fitting, "FIT_TIMEOUT", 3)
+    x = np.linspace(0, 1, 11)
+    data = np.sin(x)
+    results = {}
+
+    def run(name, delay):
+        results[name] = fit_in_subprocess(
+            FitSpec(x, data, ZeroFit, fit_kwargs={"delay": delay})
+        )
+
+    hung = threading.Thread(target=run, args=("hung", 3600))
+    # Starts later and is still running when the hung fit's worker is killed.
+    other = threading.Thread(target=run, args=("other", 2.5))
+    try:
+        hung.start()
+        time.sleep(1.5)
+        other.start()
+        hung.join(30)
+        other.join(30)
+
+        assert results["hung"] is None
+        assert results["other"] is not None
+        # The next fit gets a working process.
+        assert fit_in_subprocess(FitSpec(x, data, ZeroFit)) is not None
+    finally:
+        fitting.cleanup_fitting_pool()